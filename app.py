@@ -1,18 +1,65 @@
+import os
 import sys
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from gui.windows.main_window import MainWindow
-from settings import ICON_LOGO
-from logger import Logger
+# Installed builds run from a read-only location, so do not try to write .pyc files there.
+# This must run before any other import to take effect.
+if getattr(sys, 'frozen', False) or os.environ.get('CONCRETUS_FROZEN'):
+    sys.dont_write_bytecode = True
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QApplication, QSplashScreen
+from PyQt6.QtGui import QPixmap
+from settings import IMAGE_LOGO
+from logger import get_logger, flush_startup_logs
 
 # Initialize the logger
-logger = Logger(__name__)
+logger = get_logger(__name__)
+
+def set_application_icon(app):
+    """
+    Set the application icon. The .ico decoding (and its image plugin) is only loaded when this is called.
+
+    :param QApplication app: The running application.
+    """
+
+    from PyQt6.QtGui import QIcon
+    from settings import ICON_LOGO
 
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(str(ICON_LOGO)))
+
+def main():
+    """
+    Start the Concretus application and run the Qt event loop.
+
+    :return: The exit code returned by the event loop.
+    :rtype: int
+    """
+
+    # Qt subsystems that the application does not use are turned off before QApplication is created
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DisableSessionManager, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+
+    # Concretus takes no Qt command-line options, so only the program name is handed over to Qt
+    app = QApplication(sys.argv[:1])
     logger.info("The application has just started")
+
+    # Show a splash screen while the main window (and every widget it depends on) is being imported
+    splash = QSplashScreen(QPixmap(str(IMAGE_LOGO)))
+    splash.show()
+    app.processEvents()
+
+    from gui.windows.main_window import MainWindow
+
     window = MainWindow()
+    splash.finish(window)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+
+    # Set the icon once the event loop is running, so the first frame is not delayed by it
+    QTimer.singleShot(0, lambda: set_application_icon(app))
+    # Write the startup log records to disk once the window is already visible
+    QTimer.singleShot(0, flush_startup_logs)
+    return app.exec()
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -34,6 +34,17 @@ hiddenimports = [
     'numpy.polynomial',
 ]
 
+# Modules that are never imported by the application, kept out of the bundle
+excludes = [
+    'tkinter',
+    'pydoc_data',
+    'PyQt6.QtQml',
+    'PyQt6.QtQuick',
+    'PyQt6.QtMultimedia',
+    'PyQt6.QtWebEngineCore',
+    'PyQt6.QtWebEngineWidgets',
+]
+
 # Add all your submodules
 for module in ['core', 'gui', 'reports']:
     if os.path.isdir(module):  # Check that the module exists
@@ -48,11 +59,12 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=2,  # Same as running with -OO: asserts and docstrings are stripped from the bundled bytecode
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -1,15 +1,85 @@
 from dataclasses import dataclass, field
-from math import log, exp
+from functools import lru_cache, cached_property
+from math import log, exp, fsum
 
 from core.regular_concrete.models.regular_concrete_data_model import RegularConcreteDataModel
 from core.regular_concrete.models.aci_data_model import ACIDataModel
-from logger import Logger
+from logger import get_logger
 from settings import (K_FACTOR, QUARTILES, WATER_CONTENT_NAE, WATER_CONTENT_AE, MAX_W_CM_ACI,
-                      MIN_CEMENTITIOUS_CONTENT_ACI, ENTRAPPED_AIR, ENTRAINED_AIR, COEFFICIENTS, CONVERSION_FACTORS)
+                      MIN_CEMENTITIOUS_CONTENT_ACI, ENTRAPPED_AIR, ENTRAINED_AIR, COEFFICIENTS, CONVERSION_FACTORS,
+                      WATER_REDUCTION_SCM_ACI)
+
+# Lookup tables flattened at import time, so that each value is found with a single hash lookup
+_WATER_CONTENT = {
+    (slump_range, nms, entrained_air): value
+    for entrained_air, table in ((True, WATER_CONTENT_AE), (False, WATER_CONTENT_NAE))
+    for slump_range, row in table.items()
+    for nms, value in row.items()
+} # Key: (slump_range, nms, entrained_air)
+_ENTRAINED_AIR = {
+    (exposure_class, nms): value
+    for exposure_class, row in ENTRAINED_AIR["ACI"].items()
+    for nms, value in row.items()
+} # Key: (exposure_class, nms)
+_COEFFICIENTS = {nms: (coefficients['a'], coefficients['b']) for nms, coefficients in COEFFICIENTS.items()}
+
+# Valid NMS of each table, reported by the error messages
+_VALID_NMS_WATER = {entrained_air: tuple(next(iter(table.values())))
+                    for entrained_air, table in ((True, WATER_CONTENT_AE), (False, WATER_CONTENT_NAE))}
+_VALID_NMS_ENTRAPPED = tuple(ENTRAPPED_AIR)
+_VALID_NMS_ENTRAINED = {exposure_class: tuple(row) for exposure_class, row in ENTRAINED_AIR["ACI"].items()}
+
+
+@lru_cache(maxsize=256)
+def _coarse_content(nms, fineness_modulus, compacted_bulk_density, absorption):
+    """
+    Pure form of CoarseAggregate.coarse_content (the inputs must be already validated).
+
+    :return: A tuple containing the SSD content, the oven-dry content (in kg/m³) and the bulk volume.
+    :rtype: tuple[float, float, float]
+    """
+
+    # Get the coefficients for the linear regression
+    a, b = _COEFFICIENTS[nms]
+
+    # Volume of oven-dry-rodded coarse aggregate per unit volume of concrete
+    bulk_volume = a * fineness_modulus + b
+
+    # The oven-dry mass of coarse aggregate for a cubic meter of concrete
+    coarse_content_dry = bulk_volume * compacted_bulk_density
+
+    # Absorption will be taken into account to convert the dry-rodded mass to the corresponding SSD mass
+    coarse_content_ssd = coarse_content_dry * (1 + absorption / 100)
+
+    return coarse_content_ssd, coarse_content_dry, bulk_volume
+
+@lru_cache(maxsize=1024)
+def _w_cm_ratio(target_strength, entrained_air, exposure_classes):
+    """
+    Pure form of AbramsLaw.water_cementitious_materials_ratio (exposure_classes must be a tuple).
+
+    :return: A tuple containing the w/cm by strength, the w/cm by durability and the governing (lower) w/cm.
+    :rtype: tuple[float, float, float]
+    """
+
+    # Different equations are used for air-entrained and non-air-entrained concrete
+    if entrained_air:
+        w_cm_by_strength = -0.368 * log(target_strength) + 1.7
+    else:
+        w_cm_by_strength = 1.1318 * exp(-0.025 * target_strength)
+
+    # The most restrictive (lowest) w/cm from all exposure classes is selected (1.0 if none restricts it)
+    w_cm_by_durability = 1.0
+    for exposure_class in exposure_classes:
+        w_cm_limit = MAX_W_CM_ACI.get(exposure_class, 1.0)
+        if w_cm_limit < w_cm_by_durability:
+            w_cm_by_durability = w_cm_limit
+
+    return w_cm_by_strength, w_cm_by_durability, min(w_cm_by_strength, w_cm_by_durability)
 
 
 # ------------------------------------------------ Class for materials ------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class CementitiousMaterial:
     relative_density: float
     aci_data_model: ACIDataModel = field(init=False, repr=False)
@@ -33,12 +103,13 @@ class CementitiousMaterial:
         :rtype: float
         """
 
-        if water_density == 0 or relative_density == 0:
+        try:
+            return content / (relative_density * water_density)
+        except ZeroDivisionError:
             error_msg = (f"The relative density of {cementitious_type} is {relative_density}. "
                          f"The water density is {water_density}. None can be zero")
             self.aci_data_model.add_calculation_error('Cementitious volume', error_msg)
-            raise ZeroDivisionError(error_msg)
-        return content / (relative_density * water_density)
+            raise ZeroDivisionError(error_msg) from None
 
     def cementitious_content(self, water_content, w_cm, nms, scm_checked, scm_percentage=None, wra_checked=False,
                              wra_action_water_reducer=False, water_correction_wra=None):
@@ -78,9 +149,11 @@ class CementitiousMaterial:
         cementitious_content_final = max(initial_cementitious_content, min_cementitious_content)
 
         # Store intermediate values in the data model
-        self.aci_data_model.update_data('cementitious_material.base_content', initial_cementitious_content)
-        self.aci_data_model.update_data('cementitious_material.min_content', min_cementitious_content)
-        self.aci_data_model.update_data('cementitious_material.final_content', cementitious_content_final)
+        self.aci_data_model.update_many({
+            'cementitious_material.base_content': initial_cementitious_content,
+            'cementitious_material.min_content': min_cementitious_content,
+            'cementitious_material.final_content': cementitious_content_final
+        })
 
         # If SCM is used, calculate SCM content and cement content separately
         if scm_checked and scm_percentage is not None:
@@ -98,17 +171,17 @@ class CementitiousMaterial:
 
             return cement_content, scm_content
 
-@dataclass
+@dataclass(slots=True)
 class Cement(CementitiousMaterial):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class SCM(CementitiousMaterial):
     scm_checked: bool
     scm_type: str
     scm_percentage: int
 
-@dataclass
+@dataclass(slots=True)
 class Water:
     density: float
     aci_data_model: ACIDataModel = field(init=False, repr=False)
@@ -127,12 +200,12 @@ class Water:
         :rtype: float
         """
 
-        if density == 0:
+        try:
+            return water_content / density
+        except ZeroDivisionError:
             error_msg = f'The density is {density}. It cannot be zero'
             self.aci_data_model.add_calculation_error('Water volume', error_msg)
-            raise ValueError(error_msg)
-
-        return water_content / density
+            raise ValueError(error_msg) from None
 
     def water_content(self, slump_range, nms, entrained_air, agg_types, scm_checked=False, scm_type=None,
                       scm_percentage=None, wra_checked=False, wra_action_cement_economizer=False,
@@ -163,15 +236,12 @@ class Water:
         :rtype: float
         """
 
-        # Select the correct dictionary according to the type of concrete (with or without entrained air)
-        water_content_table = WATER_CONTENT_AE if entrained_air else WATER_CONTENT_NAE
-
-        # Get the base water content
-        water_content = water_content_table.get(slump_range, {}).get(nms)
+        # Get the base water content according to the type of concrete (with or without entrained air)
+        water_content = _WATER_CONTENT.get((slump_range, nms, bool(entrained_air)))
 
         if water_content is None:
-            valid_nms = list(next(iter(water_content_table.values())).keys())
-            error_msg = f"The NMS ({nms}) is not valid. Valid NMS values are: {valid_nms}"
+            error_msg = (f"The NMS ({nms}) is not valid. "
+                         f"Valid NMS values are: {list(_VALID_NMS_WATER[bool(entrained_air)])}")
             self.aci_data_model.add_calculation_error('Water content', error_msg)
             raise ValueError(error_msg)
 
@@ -181,21 +251,18 @@ class Water:
         water_correction_scm = 0
         water_correction_wra = 0
 
-        # Adjust according to the type of aggregate
-        if "Redondeada" in agg_types:
+        # Adjust according to the type of aggregate (rounded coarse and manufactured fine aggregates)
+        coarse_type, fine_type = agg_types
+        if coarse_type == "Redondeada":
             water_correction_coarse = -0.08 * water_content
-        if "Manufacturada" in agg_types:
+        if fine_type == "Manufacturada":
             water_correction_fine = 0.05 * water_content
 
         # Adjust according to the type of SCM (if used)
         if scm_checked:
-            if scm_type == "Cenizas volantes":
-                multiplier = scm_percentage // 10
-                reduction = (multiplier * 3) * 0.01
-                water_correction_scm = -reduction * water_content
-            elif scm_type == "Cemento de escoria":
-                multiplier = scm_percentage // 10
-                reduction = (multiplier * 5) * 0.01
+            scm_reduction = WATER_REDUCTION_SCM_ACI.get(scm_type) # Only fly ash and slag cement reduce the water
+            if scm_reduction:
+                reduction = (scm_percentage // 10 * scm_reduction) * 0.01
                 water_correction_scm = -reduction * water_content
 
         # Apply WRA corrections if applicable
@@ -204,11 +271,13 @@ class Water:
             water_correction_wra = -reduction * water_content
 
         # Store intermediate values in data model
-        self.aci_data_model.update_data('water.water_content.base', water_content)
-        self.aci_data_model.update_data('water.water_content.coarse_aggregate_correction', water_correction_coarse)
-        self.aci_data_model.update_data('water.water_content.fine_aggregate_correction', water_correction_fine)
-        self.aci_data_model.update_data('water.water_content.scm_correction', water_correction_scm)
-        self.aci_data_model.update_data('water.water_content.wra_correction', water_correction_wra)
+        self.aci_data_model.update_many({
+            'water.water_content.base': water_content,
+            'water.water_content.coarse_aggregate_correction': water_correction_coarse,
+            'water.water_content.fine_aggregate_correction': water_correction_fine,
+            'water.water_content.scm_correction': water_correction_scm,
+            'water.water_content.wra_correction': water_correction_wra
+        })
 
         # Apply corrections to base water content
         final_water_content = (water_content + water_correction_coarse + water_correction_fine + water_correction_scm +
@@ -236,7 +305,7 @@ class Water:
 
         return water_content + (fine_content_ssd - fine_content_wet) + (coarse_content_ssd - coarse_content_wet)
 
-@dataclass
+@dataclass(slots=True)
 class Air:
     entrained_air: bool
     user_defined: float
@@ -260,8 +329,7 @@ class Air:
 
         # Validate that a value was found for the provided NMS
         if entrapped_air is None:
-            valid_nms = list(ENTRAPPED_AIR.keys())
-            error_msg = f"The NMS ({nms}) is outside the valid NMS. Valid NMS -> {valid_nms}"
+            error_msg = f"The NMS ({nms}) is outside the valid NMS. Valid NMS -> {list(_VALID_NMS_ENTRAPPED)}"
             self.aci_data_model.add_calculation_error('Entrapped air', error_msg)
             raise ValueError(error_msg)
 
@@ -278,47 +346,34 @@ class Air:
         This method determines the appropriate air content based on exposure classes and NMS.
 
         :param str nms: The nominal maximum size of the coarse aggregate.
-        :param list[str] exposure_classes: A list containing all possible exposure classes, in no particular order,
-                                           (e.g., ['F0', 'W0', 'S1', 'C2']).
+        :param Sequence[str] exposure_classes: All possible exposure classes, in no particular order,
+                                               (e.g., ('F0', 'W0', 'S1', 'C2')).
         :return: The entrained air volume (in m³), or 0 if no air entrainment is required.
         :rtype: float
         """
 
-        # Default to no entrained air
-        entrained_air_fraction = 0
-
-        # Check if any of the provided exposure classes require air entrainment
-        for exposure_class in exposure_classes:
-            # Look for exposure classes that begin with 'F' (freezing conditions)
-            if exposure_class.startswith('F') and exposure_class != 'F0':
-                # Get the air content table for the exposure class
-                air_content_table = ENTRAINED_AIR.get("ACI", {}).get(exposure_class)
+        # Find the freezing-and-thawing exposure class that requires air entrainment (F1, F2 or F3), if any
+        freezing_class = next((exposure_class for exposure_class in exposure_classes
+                               if exposure_class in ENTRAINED_AIR["ACI"]), None)
 
-                # Skip if this exposure class isn't defined in our tables
-                if air_content_table is None:
-                    continue
-
-                # Look up the required air content for the given NMS
-                air_content = air_content_table.get(nms)
-
-                # Validate that a value was found for the provided NMS
-                if air_content is None:
-                    # Get a reference to any valid exposure class table to extract valid NMS values
-                    valid_class = next(iter(ENTRAINED_AIR["ACI"]))
-                    valid_nms = list(ENTRAINED_AIR["ACI"][valid_class].keys())
-                    error_msg = f"The NMS ({nms}) is outside the valid NMS. Valid NMS -> {valid_nms}"
-                    self.aci_data_model.add_calculation_error('Entrained air', error_msg)
-                    raise ValueError(error_msg)
+        # If no applicable exposure class was found, return 0
+        if freezing_class is None:
+            return 0
 
-                # Convert from percentage to fraction
-                entrained_air_fraction = air_content / 100
+        # Look up the required air content for the given exposure class and NMS
+        air_content = _ENTRAINED_AIR.get((freezing_class, nms))
 
-                return entrained_air_fraction
+        # Validate that a value was found for the provided NMS
+        if air_content is None:
+            error_msg = (f"The NMS ({nms}) is outside the valid NMS. "
+                         f"Valid NMS -> {list(_VALID_NMS_ENTRAINED[freezing_class])}")
+            self.aci_data_model.add_calculation_error('Entrained air', error_msg)
+            raise ValueError(error_msg)
 
-        # If no applicable exposure class was found, return 0
-        return entrained_air_fraction
+        # Convert from percentage to fraction
+        return air_content / 100
 
-@dataclass
+@dataclass(slots=True)
 class Aggregate:
     agg_type: str
     relative_density: float
@@ -347,14 +402,14 @@ class Aggregate:
         :rtype: float
         """
 
-        if loose_bulk_density == 0:
+        LITERS_PER_CUBIC_METER = 1000
+        try:
+            # The loose bulk density is in kg/m³, so the volume in m³ is converted to L by multiplying by 1000
+            return content * LITERS_PER_CUBIC_METER / loose_bulk_density
+        except ZeroDivisionError:
             error_msg = f"The loose bulk density of the {aggregate_type} aggregate cannot be zero"
             self.aci_data_model.add_calculation_error(f"{aggregate_type} apparent volumen", error_msg)
-            raise ZeroDivisionError(error_msg)
-
-        LITERS_PER_CUBIC_METER = 1000
-        # The loose bulk density is in kg/m³, so it is converted to kg/(L) by dividing by 1000
-        return content / (loose_bulk_density / LITERS_PER_CUBIC_METER)
+            raise ZeroDivisionError(error_msg) from None
 
     def absolute_volume(self, content, water_density, relative_density, aggregate_type="aggregate"):
         """
@@ -372,11 +427,12 @@ class Aggregate:
         :rtype: float
         """
 
-        if water_density == 0 or relative_density == 0:
+        try:
+            return content / (relative_density * water_density)
+        except ZeroDivisionError:
             error_msg = f"The relative density ({relative_density}) or the water density ({water_density}) cannot be zero"
             self.aci_data_model.add_calculation_error(f"{aggregate_type} absolute volume", error_msg)
-            raise ZeroDivisionError(error_msg)
-        return content / (relative_density * water_density)
+            raise ZeroDivisionError(error_msg) from None
 
     def content_moisture_correction(self, ssd_content, moisture_content, absorption):
         """
@@ -394,15 +450,14 @@ class Aggregate:
         :rtype: float
         """
 
-        denominator = 100 + absorption
-        if denominator == 0:
+        try:
+            return ssd_content * ((100 + moisture_content) / (100 + absorption))
+        except ZeroDivisionError:
             error_msg = f"Invalid absorption value: {absorption}"
             self.aci_data_model.add_calculation_error('Aggregate moisture correction', error_msg)
-            raise ValueError(error_msg)
+            raise ValueError(error_msg) from None
 
-        return ssd_content * ((100 + moisture_content) / denominator)
-
-@dataclass
+@dataclass(slots=True)
 class FineAggregate(Aggregate):
     fineness_modulus: float
 
@@ -434,8 +489,8 @@ class FineAggregate(Aggregate):
             self.aci_data_model.add_calculation_error('Fine content', error_msg)
             raise ValueError(error_msg)
 
-        # Total volume except for fine aggregate
-        partial_volume = water_volume + air_volume + cement_abs_volume + scm_abs_volume + coarse_abs_volume
+        # Total volume except for fine aggregate (exactly rounded, since it is then subtracted from 1)
+        partial_volume = fsum((water_volume, air_volume, cement_abs_volume, scm_abs_volume, coarse_abs_volume))
 
         # The calculated absolute volume of fine aggregate
         fine_abs_volume = 1 - partial_volume
@@ -451,7 +506,7 @@ class FineAggregate(Aggregate):
 
         return fine_content_ssd
 
-@dataclass
+@dataclass(slots=True)
 class CoarseAggregate(Aggregate):
     nominal_max_size: str
 
@@ -469,7 +524,7 @@ class CoarseAggregate(Aggregate):
         """
 
         # Validate input parameters
-        if nms not in COEFFICIENTS:
+        if nms not in _COEFFICIENTS:
             error_msg = f"Nominal maximum size ({nms}) not found in coefficients table"
             self.aci_data_model.add_calculation_error('Coarse content', error_msg)
             raise KeyError(error_msg)
@@ -484,36 +539,55 @@ class CoarseAggregate(Aggregate):
             self.aci_data_model.add_calculation_error('Coarse content', error_msg)
             raise ValueError(error_msg)
 
-        # Get the coefficients for the linear regression
-        a = COEFFICIENTS.get(nms, {}).get('a')
-        b = COEFFICIENTS.get(nms, {}).get('b')
-
-        # Volume of oven-dry-rodded coarse aggregate per unit volume of concrete
-        bulk_volume = a * fineness_modulus + b
-
-        # The oven-dry mass of coarse aggregate for a cubic meter of concrete
-        coarse_content_dry = bulk_volume * compacted_bulk_density
-
-        # Absorption will be taken into account to convert the dry-rodded mass to the corresponding SSD mass
-        coarse_content_ssd = coarse_content_dry * (1 + absorption / 100)
+        # Pure arithmetic, cached because sweeps repeat the same aggregate properties
+        coarse_content_ssd, coarse_content_dry, bulk_volume = _coarse_content(nms, fineness_modulus,
+                                                                              compacted_bulk_density, absorption)
 
         # Store intermediate values in the data model
-        self.aci_data_model.update_data('coarse_aggregate.oven_dry_rodded_bulk_volume', bulk_volume)
-        self.aci_data_model.update_data('coarse_aggregate.coarse_content_oven_dry', coarse_content_dry)
+        self.aci_data_model.update_many({
+            'coarse_aggregate.oven_dry_rodded_bulk_volume': bulk_volume,
+            'coarse_aggregate.coarse_content_oven_dry': coarse_content_dry
+        })
 
         return coarse_content_ssd
 
-@dataclass
+@dataclass(slots=True)
 class FreshConcrete:
     slump_range: str
 
-@dataclass
+@dataclass(slots=True)
 class HardenedConcrete:
     design_strength: int
     spec_strength_time: str
     exposure_classes: dict
 
-@dataclass
+def _target_known_le35(design_strength, z, k, std_dev_value):
+    """Candidate target strengths (f_cr_1, f_cr_2) for a known standard deviation and f'c <= 35 MPa."""
+
+    return (design_strength - z * k * std_dev_value,
+            design_strength - (z - 1) * k * std_dev_value - 3.5)
+
+def _target_known_gt35(design_strength, z, k, std_dev_value):
+    """Candidate target strengths (f_cr_1, f_cr_2) for a known standard deviation and f'c > 35 MPa."""
+
+    return (design_strength - z * k * std_dev_value,
+            0.9 * design_strength - (z - 1) * k * std_dev_value)
+
+def _target_unknown(design_strength):
+    """Target strength and margin (f_cr, margin) for an unknown standard deviation, or (None, None) if no margin."""
+
+    if design_strength < 21:
+        return design_strength + 7.0, 7.0
+    if design_strength <= 35:
+        return design_strength + 8.3, 8.3
+    if design_strength > 35:
+        return 1.10 * design_strength + 5.0, 5.0
+    return None, None
+
+# Kernel for the known standard deviation case, keyed by design_strength > 35
+_TARGET_KNOWN_DISPATCH = {False: _target_known_le35, True: _target_known_gt35}
+
+@dataclass(slots=True)
 class StandardDeviation:
     std_dev_known: bool
     std_dev_value: float
@@ -522,13 +596,15 @@ class StandardDeviation:
     std_dev_unknown: bool
     aci_data_model: ACIDataModel = field(init=False, repr=False)
 
-    def target_strength(self, design_strength, std_dev_known, std_dev_value, sample_size, defective_level, std_dev_unknown):
+    def target_strength(self, design_strength, std_dev_known=None, std_dev_value=None, sample_size=None,
+                        defective_level=None, std_dev_unknown=None):
         """
         Calculate the target (or required average compressive) strength based on design strength and variability parameters.
 
         For std_dev_known == True and sample_size >= 15, it calculates two candidate strengths
         using a k-factor (from sample_size) and a z value (from defective_level), then uses the maximum.
         For std_dev_unknown == True, it uses predefined margins based on the design strength.
+        The variability parameters that are not given are taken from the instance.
 
         :param int design_strength: The design strength of the concrete in megapascal (MPa).
         :param bool std_dev_known: True if the standard deviation is known.
@@ -540,41 +616,40 @@ class StandardDeviation:
         :rtype: float
         """
 
+        if std_dev_known is None:
+            std_dev_known = self.std_dev_known
+        if std_dev_value is None:
+            std_dev_value = self.std_dev_value
+        if sample_size is None:
+            sample_size = self.sample_size
+        if defective_level is None:
+            defective_level = self.defective_level
+        if std_dev_unknown is None:
+            std_dev_unknown = self.std_dev_unknown
+
         # Case 1: The standard deviation is known and the sample size is greater than or equal to 15
         if std_dev_known and sample_size >= 15:
-            k = K_FACTOR.get(sample_size, 1.00)  # Get k-factor based on sample size
-            z = QUARTILES.get(defective_level)  # Get z value (quartile) based on defective level
-
-            if design_strength <= 35:
-                f_cr_1 = design_strength - z * k * std_dev_value
-                f_cr_2 = design_strength - (z - 1) * k * std_dev_value - 3.5
-            else:  # design_strength > 35
-                f_cr_1 = design_strength - z * k * std_dev_value
-                f_cr_2 = 0.9 * design_strength - (z - 1) * k * std_dev_value
+            k = K_FACTOR.get(sample_size, 1.00)
+            z = QUARTILES.get(defective_level)
 
+            f_cr_1, f_cr_2 = _TARGET_KNOWN_DISPATCH[design_strength > 35](design_strength, z, k, std_dev_value)
             f_cr = max(f_cr_1, f_cr_2)
 
             # Update the ACI data model with intermediate values
-            self.aci_data_model.update_data('spec_strength.target_strength.k_factor', k)
-            self.aci_data_model.update_data('spec_strength.target_strength.z_value', z)
-            self.aci_data_model.update_data('spec_strength.target_strength.f_cr_1', f_cr_1)
-            self.aci_data_model.update_data('spec_strength.target_strength.f_cr_2', f_cr_2)
+            self.aci_data_model.update_many({
+                'spec_strength.target_strength.k_factor': k,
+                'spec_strength.target_strength.z_value': z,
+                'spec_strength.target_strength.f_cr_1': f_cr_1,
+                'spec_strength.target_strength.f_cr_2': f_cr_2
+            })
 
         # Case 2: The standard deviation is unknown
         elif std_dev_unknown:
-            margin = None
-            if design_strength < 21:
-                margin = 7.0
-            elif 21 <= design_strength <= 35:
-                margin = 8.3
-            elif design_strength > 35:
-                margin = 5.0
-                design_strength = 1.10 * design_strength
+            f_cr, margin = _target_unknown(design_strength)
 
             # Update the data model for the margin
             if margin is not None:
                 self.aci_data_model.update_data('spec_strength.target_strength.margin', margin)
-                f_cr = design_strength + margin
             else:
                 # If no margin was assigned, raises a value error exception
                 error_msg = f"No margin found for the design strength: {design_strength}"
@@ -589,7 +664,7 @@ class StandardDeviation:
 
         return f_cr
 
-@dataclass
+@dataclass(slots=True)
 class AbramsLaw:
     aci_data_model: ACIDataModel = field(init=False, repr=False)
 
@@ -603,34 +678,28 @@ class AbramsLaw:
 
         :param float target_strength: The target compressive strength of concrete in MPa.
         :param bool entrained_air: Whether the concrete is air-entrained (True) or non-air-entrained (False).
-        :param list[str] exposure_classes: A list containing all possible exposure classes, in no particular order,
-                                           (e.g., ['F0', 'W0', 'S1', 'C2']).
+        :param Sequence[str] exposure_classes: All possible exposure classes, in no particular order,
+                                               (e.g., ('F0', 'W0', 'S1', 'C2')).
         :return: The recommended water-to-cementitious materials ratio.
         :rtype: float
         """
 
-        # Calculate w/cm ratio based on target strength
-        # Different equations are used for air-entrained and non-air-entrained concrete
-        if entrained_air:
-            w_cm_by_strength = -0.368 * log(target_strength) + 1.7
-        else:
-            w_cm_by_strength = 1.1318 * exp(-0.025 * target_strength)
-
-        # Calculate w/cm ratio based on durability requirements
-        # The most restrictive (lowest) w/cm from all exposure classes is selected
-        w_cm_by_durability = [MAX_W_CM_ACI.get(exposure_class, 1.0) for exposure_class in exposure_classes]
-        w_cm_by_durability = min(w_cm_by_durability)
+        # The w/cm ratio by strength and by durability, the more restrictive (lower) one satisfies both.
+        # Cached, since sweeps repeat the same strength and exposure classes.
+        # This could change later if a minimum cementitious material content is selected
+        w_cm_by_strength, w_cm_by_durability, w_cm = _w_cm_ratio(target_strength, bool(entrained_air),
+                                                                 tuple(exposure_classes))
 
         # Store intermediate calculation results in the ACI data model for reference
-        self.aci_data_model.update_data('water_cementitious_materials_ratio.w_cm_by_strength', w_cm_by_strength)
-        self.aci_data_model.update_data('water_cementitious_materials_ratio.w_cm_by_durability', w_cm_by_durability)
-        self.aci_data_model.update_data('water_cementitious_materials_ratio.w_cm_previous', min(w_cm_by_strength, w_cm_by_durability))
+        self.aci_data_model.update_many({
+            'water_cementitious_materials_ratio.w_cm_by_strength': w_cm_by_strength,
+            'water_cementitious_materials_ratio.w_cm_by_durability': w_cm_by_durability,
+            'water_cementitious_materials_ratio.w_cm_previous': w_cm
+        })
 
-        # Return the more restrictive (lower) w/cm ratio to satisfy both strength and durability
-        # This could change later if a minimum cementitious material content is selected
-        return min(w_cm_by_strength, w_cm_by_durability)
+        return w_cm
 
-@dataclass
+@dataclass(slots=True)
 class Admixture:
     aci_data_model: ACIDataModel = field(init=False, repr=False)
 
@@ -661,14 +730,15 @@ class Admixture:
         :rtype: float
         """
 
-        if water_density == 0 or relative_density == 0:
+        try:
+            return content / (relative_density * water_density)
+        except ZeroDivisionError:
             error_msg = (f"The admixture relative density is {relative_density}. "
                          f"The water density is {water_density}. None can be zero")
             self.aci_data_model.add_calculation_error('Admixture volume', error_msg)
-            raise ZeroDivisionError(error_msg)
-        return content / (relative_density * water_density)
+            raise ZeroDivisionError(error_msg) from None
 
-@dataclass
+@dataclass(slots=True)
 class WRA(Admixture):
     wra_checked: bool
     wra_action_plasticizer: bool
@@ -678,13 +748,93 @@ class WRA(Admixture):
     dosage: float
     effectiveness: float
 
-@dataclass
+@dataclass(slots=True)
 class AEA(Admixture):
     aea_checked: bool
     relative_density: float
     dosage: float
 
 
+# Design values read by ACI.load_inputs
+_INPUT_PATHS = (
+    'field_requirements.strength.spec_strength',
+    'field_requirements.strength.std_dev_known.std_dev_value',
+    'cementitious_materials.cement_relative_density',
+    'cementitious_materials.SCM.SCM_relative_density',
+    'cementitious_materials.SCM.SCM_checked',
+    'cementitious_materials.SCM.SCM_type',
+    'cementitious_materials.SCM.SCM_content',
+    'water.water_density',
+    'field_requirements.entrained_air_content.is_checked',
+    'field_requirements.entrained_air_content.user_defined',
+    'field_requirements.entrained_air_content.exposure_defined',
+    'fine_aggregate.info.type',
+    'fine_aggregate.physical_prop.relative_density_SSD',
+    'fine_aggregate.physical_prop.PUS',
+    'fine_aggregate.physical_prop.PUC',
+    'fine_aggregate.moisture.moisture_content',
+    'fine_aggregate.moisture.absorption_content',
+    'fine_aggregate.gradation.passing',
+    'fine_aggregate.fineness_modulus',
+    'coarse_aggregate.info.type',
+    'coarse_aggregate.physical_prop.relative_density_SSD',
+    'coarse_aggregate.physical_prop.PUS',
+    'coarse_aggregate.physical_prop.PUC',
+    'coarse_aggregate.moisture.moisture_content',
+    'coarse_aggregate.moisture.absorption_content',
+    'coarse_aggregate.gradation.passing',
+    'coarse_aggregate.NMS',
+    'field_requirements.slump_range',
+    'field_requirements.strength.spec_strength_time',
+    'validation.exposure_classes',
+    'field_requirements.strength.std_dev_known.std_dev_known_enabled',
+    'field_requirements.strength.std_dev_known.test_nro',
+    'field_requirements.strength.std_dev_known.defective_level',
+    'field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled',
+    'chemical_admixtures.WRA.WRA_checked',
+    'chemical_admixtures.WRA.WRA_action.plasticizer',
+    'chemical_admixtures.WRA.WRA_action.water_reducer',
+    'chemical_admixtures.WRA.WRA_action.cement_economizer',
+    'chemical_admixtures.WRA.WRA_relative_density',
+    'chemical_admixtures.WRA.WRA_dosage',
+    'chemical_admixtures.WRA.WRA_effectiveness',
+    'chemical_admixtures.AEA.AEA_checked',
+    'chemical_admixtures.AEA.AEA_relative_density',
+    'chemical_admixtures.AEA.AEA_dosage',
+)
+
+# Key path in the ACI data model of each calculation result (the same keys as ACI.calculation_results)
+_RESULT_PATHS = {
+    "target_strength_value": "spec_strength.target_strength.target_strength_value",
+    "w_cm": "water_cementitious_materials_ratio.w_cm",
+    "entrapped_air_content": "air.entrapped_air_content",
+    "entrained_air_content": "air.entrained_air_content",
+    "final_content": "water.water_content.final_content",
+    "water_content_correction": "water.water_content_correction",
+    "water_abs_volume": "water.water_abs_volume",
+    "water_volume": "water.water_volume",
+    "cement_content": "cementitious_material.cement.cement_content",
+    "cement_abs_volume": "cementitious_material.cement.cement_abs_volume",
+    "cement_volume": "cementitious_material.cement.cement_volume",
+    "scm_content": "cementitious_material.scm.scm_content",
+    "scm_abs_volume": "cementitious_material.scm.scm_abs_volume",
+    "scm_volume": "cementitious_material.scm.scm_volume",
+    "fine_content_ssd": "fine_aggregate.fine_content_ssd",
+    "fine_content_wet": "fine_aggregate.fine_content_wet",
+    "fine_abs_volume": "fine_aggregate.fine_abs_volume",
+    "fine_volume": "fine_aggregate.fine_volume",
+    "coarse_content_ssd": "coarse_aggregate.coarse_content_ssd",
+    "coarse_content_wet": "coarse_aggregate.coarse_content_wet",
+    "coarse_abs_volume": "coarse_aggregate.coarse_abs_volume",
+    "coarse_volume": "coarse_aggregate.coarse_volume",
+    "WRA_content": "chemical_admixtures.WRA.WRA_content",
+    "WRA_volume": "chemical_admixtures.WRA.WRA_volume",
+    "AEA_content": "chemical_admixtures.AEA.AEA_content",
+    "AEA_volume": "chemical_admixtures.AEA.AEA_volume",
+    "total_abs_volume": "summation.total_abs_volume",
+    "total_content": "summation.total_content",
+}
+
 # ------------------------------------------------ Main class ------------------------------------------------
 class ACI:
     def __init__(self, data_model, aci_data_model):
@@ -695,22 +845,11 @@ class ACI:
 
         self.data_model: RegularConcreteDataModel = data_model  # Connect to the global data model
         self.aci_data_model: ACIDataModel = aci_data_model # Connect to the ACI data model
-        self.logger = Logger(__name__)  # Initialize the logger
+        self.logger = get_logger(__name__)  # Shared logger of this module
         self.logger.info('Calculation mode for the ACI method has initialized')
 
-        # References to material components (they will be created in load_inputs)
-        self.cement = None
-        self.scm = None
-        self.water = None
-        self.air = None
-        self.fine_agg = None
-        self.coarse_agg = None
-        self.fresh_concrete = None
-        self.hardened_concrete = None
-        self.std_deviation = None
-        self.abrams_law = None
-        self.wra = None
-        self.aea = None
+        # The material components (self.cement, self.scm, ...) are created lazily, on first access,
+        # from the values loaded in load_inputs (see the cached properties below)
 
         # Dictionary to store the calculated results for later use in the report
         self.calculation_results = {}
@@ -730,122 +869,199 @@ class ACI:
         if value is None:
             return None
 
-        # Get the current unit system from the data model, e.g. "MKS" or "SI"
-        current_units = self.data_model.units
-
         # Look up the conversion factor for the current unit system and the target unit
-        factor = CONVERSION_FACTORS.get(current_units, {}).get(unit)
+        factor = self._unit_factors.get(unit)
         if factor is None:
             # Log a warning if no factor is found
-            self.logger.warning(
-                f"No conversion factor found for unit system '{current_units}' and target unit '{unit}'")
+            self.logger.warning("No conversion factor found for unit system '%s' and target unit '%s'",
+                                self.data_model.units, unit)
             return None
 
         # Return the converted value by multiplying with the factor.
         return value * factor
 
+    # -------------------------------------------- Material components --------------------------------------------
+    # Names of the cached properties that depend on the loaded inputs
+    _CACHED_INPUTS = ('_unit_factors', '_inputs', 'cement', 'scm', 'water', 'air', 'fine_agg', 'coarse_agg',
+                      'fresh_concrete', 'hardened_concrete', 'std_deviation', 'abrams_law', 'wra', 'aea')
+
+    @cached_property
+    def _unit_factors(self):
+        """Conversion factors of the current unit system of the data model (e.g. "MKS" or "SI"), by unit type."""
+
+        return CONVERSION_FACTORS.get(self.data_model.units, {})
+
+    @cached_property
+    def _inputs(self):
+        """Design values read from the data model (with the unit conversion applied), keyed by key path."""
+
+        # Fetch all the design values needed at once
+        values = self.data_model.get_design_values(_INPUT_PATHS)
+
+        # Convert units if necessary. Only MKS inputs are converted: the "stress" factor of the SI system
+        # converts the other way (kgf/cm² -> MPa), so it must not be applied to SI inputs
+        if self.data_model.units == "MKS":
+            factor = self._unit_factors["stress"]
+            for key_path in ('field_requirements.strength.spec_strength',
+                             'field_requirements.strength.std_dev_known.std_dev_value'):
+                value = values[key_path]
+                values[key_path] = value * factor if value is not None else None
+
+        return values
+
+    @cached_property
+    def cement(self):
+        cement = Cement(relative_density=self._inputs['cementitious_materials.cement_relative_density'])
+        cement.aci_data_model = self.aci_data_model
+        return cement
+
+    @cached_property
+    def scm(self):
+        values = self._inputs
+        scm = SCM(
+            relative_density=values['cementitious_materials.SCM.SCM_relative_density'],
+            scm_checked=values['cementitious_materials.SCM.SCM_checked'],
+            scm_type=values['cementitious_materials.SCM.SCM_type'],
+            scm_percentage=values['cementitious_materials.SCM.SCM_content']
+        )
+        scm.aci_data_model = self.aci_data_model
+        return scm
+
+    @cached_property
+    def water(self):
+        water = Water(density=self._inputs['water.water_density'])
+        water.aci_data_model = self.aci_data_model
+        return water
+
+    @cached_property
+    def air(self):
+        values = self._inputs
+        air = Air(
+            entrained_air=values['field_requirements.entrained_air_content.is_checked'],
+            user_defined=values['field_requirements.entrained_air_content.user_defined'],
+            exposure_defined=values['field_requirements.entrained_air_content.exposure_defined']
+        )
+        air.aci_data_model = self.aci_data_model
+        return air
+
+    @cached_property
+    def fine_agg(self):
+        values = self._inputs
+        fine_agg = FineAggregate(
+            agg_type=values["fine_aggregate.info.type"],
+            relative_density=values["fine_aggregate.physical_prop.relative_density_SSD"],
+            loose_bulk_density=values["fine_aggregate.physical_prop.PUS"],
+            compacted_bulk_density=values["fine_aggregate.physical_prop.PUC"],
+            moisture_content=values["fine_aggregate.moisture.moisture_content"],
+            moisture_absorption=values["fine_aggregate.moisture.absorption_content"],
+            grading=values["fine_aggregate.gradation.passing"],
+            fineness_modulus=values["fine_aggregate.fineness_modulus"]
+        )
+        fine_agg.aci_data_model = self.aci_data_model
+        return fine_agg
+
+    @cached_property
+    def coarse_agg(self):
+        values = self._inputs
+        coarse_agg = CoarseAggregate(
+            agg_type=values["coarse_aggregate.info.type"],
+            relative_density=values["coarse_aggregate.physical_prop.relative_density_SSD"],
+            loose_bulk_density=values["coarse_aggregate.physical_prop.PUS"],
+            compacted_bulk_density=values["coarse_aggregate.physical_prop.PUC"],
+            moisture_content=values["coarse_aggregate.moisture.moisture_content"],
+            moisture_absorption=values["coarse_aggregate.moisture.absorption_content"],
+            grading=values["coarse_aggregate.gradation.passing"],
+            nominal_max_size=values["coarse_aggregate.NMS"]
+        )
+        coarse_agg.aci_data_model = self.aci_data_model
+        return coarse_agg
+
+    @cached_property
+    def fresh_concrete(self):
+        return FreshConcrete(slump_range=self._inputs["field_requirements.slump_range"])
+
+    @cached_property
+    def hardened_concrete(self):
+        values = self._inputs
+        return HardenedConcrete(
+            design_strength=values['field_requirements.strength.spec_strength'],
+            spec_strength_time=values["field_requirements.strength.spec_strength_time"],
+            exposure_classes=values["validation.exposure_classes"]
+        )
+
+    @cached_property
+    def std_deviation(self):
+        values = self._inputs
+        std_deviation = StandardDeviation(
+            std_dev_known=values["field_requirements.strength.std_dev_known.std_dev_known_enabled"],
+            std_dev_value=values['field_requirements.strength.std_dev_known.std_dev_value'],
+            sample_size=values["field_requirements.strength.std_dev_known.test_nro"],
+            defective_level=values["field_requirements.strength.std_dev_known.defective_level"],
+            std_dev_unknown=values["field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled"]
+        )
+        std_deviation.aci_data_model = self.aci_data_model
+        return std_deviation
+
+    @cached_property
+    def abrams_law(self):
+        abrams_law = AbramsLaw()
+        abrams_law.aci_data_model = self.aci_data_model
+        return abrams_law
+
+    @cached_property
+    def wra(self):
+        values = self._inputs
+        wra = WRA(
+            wra_checked=values['chemical_admixtures.WRA.WRA_checked'],
+            wra_action_plasticizer=values['chemical_admixtures.WRA.WRA_action.plasticizer'],
+            wra_action_water_reducer=values['chemical_admixtures.WRA.WRA_action.water_reducer'],
+            wra_action_cement_economizer=values['chemical_admixtures.WRA.WRA_action.cement_economizer'],
+            relative_density=values['chemical_admixtures.WRA.WRA_relative_density'],
+            dosage=values['chemical_admixtures.WRA.WRA_dosage'],
+            effectiveness=values['chemical_admixtures.WRA.WRA_effectiveness']
+        )
+        wra.aci_data_model = self.aci_data_model
+        return wra
+
+    @cached_property
+    def aea(self):
+        values = self._inputs
+        aea = AEA(
+            aea_checked=values['chemical_admixtures.AEA.AEA_checked'],
+            relative_density=values['chemical_admixtures.AEA.AEA_relative_density'],
+            dosage=values['chemical_admixtures.AEA.AEA_dosage']
+        )
+        aea.aci_data_model = self.aci_data_model
+        return aea
+
+    def invalidate_inputs(self):
+        """
+        Discard the loaded inputs and the material components built from them,
+        so that they are created again from the data model on next access.
+        """
+
+        for name in self._CACHED_INPUTS:
+            self.__dict__.pop(name, None)
+
+    # -------------------------------------------- Calculation process --------------------------------------------
     def load_inputs(self):
         """
-        Load data from the data model and perform unit conversion for selected parameters,
-        and instantiates the necessary objects.
+        Load data from the data model and perform unit conversion for selected parameters.
+        The material components are instantiated lazily, on first access, from these values.
         """
 
+        # Discard the components of a previous run, the design data may have changed since then
+        self.invalidate_inputs()
+
+        # Only the access to the data model is guarded, the components are built later on demand
         try:
-            # Convert units if necessary
-            design_strength = self.data_model.get_design_value('field_requirements.strength.spec_strength')
-            std_dev_value = self.data_model.get_design_value('field_requirements.strength.std_dev_known.std_dev_value')
-            if self.data_model.units == "MKS":
-                design_strength = self.convert_value(design_strength, "stress")
-                std_dev_value = self.convert_value(std_dev_value, "stress")
-
-            # Instantiate the components with their corresponding data
-            self.cement = Cement(
-                relative_density=self.data_model.get_design_value('cementitious_materials.cement_relative_density')
-            )
-            self.scm = SCM(
-                relative_density=self.data_model.get_design_value('cementitious_materials.SCM.SCM_relative_density'),
-                scm_checked=self.data_model.get_design_value('cementitious_materials.SCM.SCM_checked'),
-                scm_type=self.data_model.get_design_value('cementitious_materials.SCM.SCM_type'),
-                scm_percentage=self.data_model.get_design_value('cementitious_materials.SCM.SCM_content')
-            )
-            self.water = Water(density=self.data_model.get_design_value('water.water_density'))
-            self.air = Air(
-                entrained_air=self.data_model.get_design_value('field_requirements.entrained_air_content.is_checked'),
-                user_defined=self.data_model.get_design_value('field_requirements.entrained_air_content.user_defined'),
-                exposure_defined=self.data_model.get_design_value('field_requirements.entrained_air_content.exposure_defined')
-            )
-            self.fine_agg = FineAggregate(
-                agg_type=self.data_model.get_design_value("fine_aggregate.info.type"),
-                relative_density=self.data_model.get_design_value("fine_aggregate.physical_prop.relative_density_SSD"),
-                loose_bulk_density=self.data_model.get_design_value("fine_aggregate.physical_prop.PUS"),
-                compacted_bulk_density=self.data_model.get_design_value("fine_aggregate.physical_prop.PUC"),
-                moisture_content=self.data_model.get_design_value("fine_aggregate.moisture.moisture_content"),
-                moisture_absorption=self.data_model.get_design_value("fine_aggregate.moisture.absorption_content"),
-                grading=self.data_model.get_design_value("fine_aggregate.gradation.passing"),
-                fineness_modulus=self.data_model.get_design_value("fine_aggregate.fineness_modulus")
-            )
-            self.coarse_agg = CoarseAggregate(
-                agg_type=self.data_model.get_design_value("coarse_aggregate.info.type"),
-                relative_density=self.data_model.get_design_value("coarse_aggregate.physical_prop.relative_density_SSD"),
-                loose_bulk_density=self.data_model.get_design_value("coarse_aggregate.physical_prop.PUS"),
-                compacted_bulk_density=self.data_model.get_design_value("coarse_aggregate.physical_prop.PUC"),
-                moisture_content=self.data_model.get_design_value("coarse_aggregate.moisture.moisture_content"),
-                moisture_absorption=self.data_model.get_design_value("coarse_aggregate.moisture.absorption_content"),
-                grading=self.data_model.get_design_value("coarse_aggregate.gradation.passing"),
-                nominal_max_size=self.data_model.get_design_value("coarse_aggregate.NMS")
-            )
-            self.fresh_concrete = FreshConcrete(slump_range=self.data_model.get_design_value("field_requirements.slump_range"))
-            self.hardened_concrete = HardenedConcrete(
-                design_strength=design_strength,
-                spec_strength_time=self.data_model.get_design_value("field_requirements.strength.spec_strength_time"),
-                exposure_classes=self.data_model.get_design_value("validation.exposure_classes")
-            )
-            self.std_deviation = StandardDeviation(
-                std_dev_known=self.data_model.get_design_value(
-                    "field_requirements.strength.std_dev_known.std_dev_known_enabled"),
-                std_dev_value=std_dev_value,
-                sample_size=self.data_model.get_design_value("field_requirements.strength.std_dev_known.test_nro"),
-                defective_level=self.data_model.get_design_value(
-                    "field_requirements.strength.std_dev_known.defective_level"),
-                std_dev_unknown=self.data_model.get_design_value(
-                    "field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled")
-            )
-            self.abrams_law = AbramsLaw()
-            self.wra = WRA(
-                wra_checked=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_checked'),
-                wra_action_plasticizer=self.data_model.get_design_value(
-                    'chemical_admixtures.WRA.WRA_action.plasticizer'),
-                wra_action_water_reducer=self.data_model.get_design_value(
-                    'chemical_admixtures.WRA.WRA_action.water_reducer'),
-                wra_action_cement_economizer=self.data_model.get_design_value(
-                    'chemical_admixtures.WRA.WRA_action.cement_economizer'),
-                relative_density=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_relative_density'),
-                dosage=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_dosage'),
-                effectiveness=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_effectiveness')
-            )
-            self.aea = AEA(
-                aea_checked=self.data_model.get_design_value('chemical_admixtures.AEA.AEA_checked'),
-                relative_density=self.data_model.get_design_value('chemical_admixtures.AEA.AEA_relative_density'),
-                dosage=self.data_model.get_design_value('chemical_admixtures.AEA.AEA_dosage')
-            )
-
-            # Connect to the ACI data model
-            self.cement.aci_data_model = self.aci_data_model
-            self.scm.aci_data_model = self.aci_data_model
-            self.water.aci_data_model = self.aci_data_model
-            self.air.aci_data_model = self.aci_data_model
-            self.fine_agg.aci_data_model = self.aci_data_model
-            self.coarse_agg.aci_data_model = self.aci_data_model
-            self.std_deviation.aci_data_model = self.aci_data_model
-            self.abrams_law.aci_data_model = self.aci_data_model
-            self.wra.aci_data_model = self.aci_data_model
-            self.aea.aci_data_model = self.aci_data_model
-
-            self.logger.debug("Input data loaded and converted successfully")
+            values = self._inputs
         except Exception as e:
-            self.logger.error(f"Error loading or converting input data: {str(e)}")
+            self.logger.error("Error loading or converting input data: %s", e)
             raise
 
+        self.logger.debug("Input data loaded and converted successfully (%d values)", len(values))
+
     def perform_calculations(self):
         """
         Execute the full calculation sequence using the material objects.
@@ -858,53 +1074,53 @@ class ACI:
         """
 
         try:
-            # A. Target Strength
-            design_strength = self.hardened_concrete.design_strength
-            std_dev_known = self.std_deviation.std_dev_known
-            std_dev_value = self.std_deviation.std_dev_value
-            sample_size = self.std_deviation.sample_size
-            defective_level = self.std_deviation.defective_level
-            std_dev_unknown = self.std_deviation.std_dev_unknown
+            # Bind the material components once, they are read many times below
+            std_deviation, abrams_law = self.std_deviation, self.abrams_law
+            fresh_concrete, hardened_concrete = self.fresh_concrete, self.hardened_concrete
+            cement, scm, water, air = self.cement, self.scm, self.water, self.air
+            fine_agg, coarse_agg = self.fine_agg, self.coarse_agg
+            wra, aea = self.wra, self.aea
 
-            target_strength = self.std_deviation.target_strength(design_strength, std_dev_known, std_dev_value,
-                                                                 sample_size, defective_level, std_dev_unknown)
+            # A. Target Strength
+            # The variability parameters are read by the StandardDeviation instance itself
+            target_strength = std_deviation.target_strength(hardened_concrete.design_strength)
 
             # B. Water Content and Absolute Volume
-            slump_range = self.fresh_concrete.slump_range
-            nominal_max_size = self.coarse_agg.nominal_max_size
-            entrained_air = self.air.entrained_air
-            agg_types = (self.coarse_agg.agg_type, self.fine_agg.agg_type)
-            scm_checked = self.scm.scm_checked
-            scm_type = self.scm.scm_type
-            scm_percentage = self.scm.scm_percentage
-            wra_checked = self.wra.wra_checked
-            wra_effectiveness = self.wra.effectiveness
-            water_density = self.water.density
-            wra_action_cement_economizer = self.wra.wra_action_cement_economizer
-            wra_action_water_reducer = self.wra.wra_action_water_reducer
-
-            water_content = self.water.water_content(slump_range, nominal_max_size, entrained_air, agg_types,
-                                                     scm_checked, scm_type, scm_percentage, wra_checked,
-                                                     wra_action_cement_economizer, wra_action_water_reducer,
-                                                     wra_effectiveness)
-            water_abs_volume = self.water.water_volume(water_content, water_density)
+            slump_range = fresh_concrete.slump_range
+            nominal_max_size = coarse_agg.nominal_max_size
+            entrained_air = air.entrained_air
+            agg_types = (coarse_agg.agg_type, fine_agg.agg_type)
+            scm_checked = scm.scm_checked
+            scm_type = scm.scm_type
+            scm_percentage = scm.scm_percentage
+            wra_checked = wra.wra_checked
+            wra_effectiveness = wra.effectiveness
+            water_density = water.density
+            wra_action_cement_economizer = wra.wra_action_cement_economizer
+            wra_action_water_reducer = wra.wra_action_water_reducer
+
+            water_content = water.water_content(slump_range, nominal_max_size, entrained_air, agg_types,
+                                                scm_checked, scm_type, scm_percentage, wra_checked,
+                                                wra_action_cement_economizer, wra_action_water_reducer,
+                                                wra_effectiveness)
+            water_abs_volume = water.water_volume(water_content, water_density)
 
             # C. Water-Cementitious Materials ratio, aka alpha or a/cm
-            exposure_classes = list(self.hardened_concrete.exposure_classes.values())
+            exposure_classes = tuple(hardened_concrete.exposure_classes.values())
 
-            w_cm = self.abrams_law.water_cementitious_materials_ratio(target_strength, entrained_air, exposure_classes)
+            w_cm = abrams_law.water_cementitious_materials_ratio(target_strength, entrained_air, exposure_classes)
 
             # D. Cementitious Materials Content and Absolute Volume
-            cement_relative_density = self.cement.relative_density
-            scm_relative_density = self.scm.relative_density
+            cement_relative_density = cement.relative_density
+            scm_relative_density = scm.relative_density
             water_correction_wra = self.aci_data_model.get_data('water.water_content.wra_correction')
 
-            cement_content, scm_content = self.cement.cementitious_content(water_content, w_cm, nominal_max_size,
-                                                                           scm_checked, scm_percentage, wra_checked,
-                                                                           wra_action_water_reducer, water_correction_wra)
-            cement_abs_volume = self.cement.absolute_volume(cement_content, water_density, cement_relative_density)
+            cement_content, scm_content = cement.cementitious_content(water_content, w_cm, nominal_max_size,
+                                                                      scm_checked, scm_percentage, wra_checked,
+                                                                      wra_action_water_reducer, water_correction_wra)
+            cement_abs_volume = cement.absolute_volume(cement_content, water_density, cement_relative_density)
             if scm_checked:
-                scm_abs_volume = self.scm.absolute_volume(scm_content, water_density, scm_relative_density, scm_type)
+                scm_abs_volume = scm.absolute_volume(scm_content, water_density, scm_relative_density, scm_type)
             else:
                 scm_abs_volume = 0
 
@@ -919,82 +1135,81 @@ class ACI:
             entrapped_air_content = 0
 
             if entrained_air:
-                if self.air.exposure_defined:
-                    entrained_air_content = self.air.entrained_air_volume(nominal_max_size, exposure_classes)
+                if air.exposure_defined:
+                    entrained_air_content = air.entrained_air_volume(nominal_max_size, exposure_classes)
                 else:
-                    entrained_air_content = self.air.user_defined / 100
+                    entrained_air_content = air.user_defined / 100
             else:
-                entrapped_air_content = self.air.entrapped_air_volume(nominal_max_size)
+                entrapped_air_content = air.entrapped_air_volume(nominal_max_size)
 
             # F. Coarse Content and Absolute Volume
-            fineness_modulus = self.fine_agg.fineness_modulus
-            compacted_bulk_density = self.coarse_agg.compacted_bulk_density
-            absorption = self.coarse_agg.moisture_absorption
-            coarse_relative_density = self.coarse_agg.relative_density
+            fineness_modulus = fine_agg.fineness_modulus
+            compacted_bulk_density = coarse_agg.compacted_bulk_density
+            absorption = coarse_agg.moisture_absorption
+            coarse_relative_density = coarse_agg.relative_density
 
-            coarse_content_ssd = self.coarse_agg.coarse_content(nominal_max_size, fineness_modulus,
-                                                                compacted_bulk_density, absorption)
-            coarse_abs_volume = self.coarse_agg.absolute_volume(coarse_content_ssd, water_density,
-                                                                coarse_relative_density, 'coarse')
+            coarse_content_ssd = coarse_agg.coarse_content(nominal_max_size, fineness_modulus,
+                                                           compacted_bulk_density, absorption)
+            coarse_abs_volume = coarse_agg.absolute_volume(coarse_content_ssd, water_density,
+                                                           coarse_relative_density, 'coarse')
 
             # G. Fine Content and Absolute Volume
-            fine_relative_density = self.fine_agg.relative_density
+            fine_relative_density = fine_agg.relative_density
 
             if entrained_air:
-                fine_content_ssd = self.fine_agg.fine_content(water_abs_volume, entrained_air_content, cement_abs_volume,
-                                                              scm_abs_volume, coarse_abs_volume, fine_relative_density,
-                                                              water_density)
+                fine_content_ssd = fine_agg.fine_content(water_abs_volume, entrained_air_content, cement_abs_volume,
+                                                         scm_abs_volume, coarse_abs_volume, fine_relative_density,
+                                                         water_density)
             else:
-                fine_content_ssd = self.fine_agg.fine_content(water_abs_volume, entrapped_air_content, cement_abs_volume,
-                                                              scm_abs_volume, coarse_abs_volume, fine_relative_density,
-                                                              water_density)
-            fine_abs_volume = self.fine_agg.absolute_volume(fine_content_ssd, water_density, fine_relative_density,
-                                                            'fine')
+                fine_content_ssd = fine_agg.fine_content(water_abs_volume, entrapped_air_content, cement_abs_volume,
+                                                         scm_abs_volume, coarse_abs_volume, fine_relative_density,
+                                                         water_density)
+            fine_abs_volume = fine_agg.absolute_volume(fine_content_ssd, water_density, fine_relative_density, 'fine')
 
             # Moisture adjustments
-            fine_moisture_content = self.fine_agg.moisture_content
-            coarse_moisture_content = self.coarse_agg.moisture_content
-            fine_moisture_absorption = self.fine_agg.moisture_absorption
-            coarse_moisture_absorption = self.coarse_agg.moisture_absorption
-
-            fine_content_wet = self.fine_agg.content_moisture_correction(fine_content_ssd, fine_moisture_content,
-                                                                         fine_moisture_absorption)
-            coarse_content_wet = self.coarse_agg.content_moisture_correction(coarse_content_ssd, coarse_moisture_content,
-                                                                             coarse_moisture_absorption)
-            water_content_correction = self.water.water_content_correction(water_content, fine_content_ssd,
-                                                                           fine_content_wet, coarse_content_ssd,
-                                                                           coarse_content_wet)
-
-            # Water Volume (adjusted by moisture correction)
-            water_volume = self.water.water_volume(water_content_correction, water_density)
+            fine_moisture_content = fine_agg.moisture_content
+            coarse_moisture_content = coarse_agg.moisture_content
+            fine_moisture_absorption = fine_agg.moisture_absorption
+            coarse_moisture_absorption = coarse_agg.moisture_absorption
+
+            fine_content_wet = fine_agg.content_moisture_correction(fine_content_ssd, fine_moisture_content,
+                                                                    fine_moisture_absorption)
+            coarse_content_wet = coarse_agg.content_moisture_correction(coarse_content_ssd, coarse_moisture_content,
+                                                                        coarse_moisture_absorption)
+            water_content_correction = water.water_content_correction(water_content, fine_content_ssd,
+                                                                      fine_content_wet, coarse_content_ssd,
+                                                                      coarse_content_wet)
+
+            # Water Volume (adjusted by moisture correction). The density was already checked in step B
+            water_volume = water_content_correction / water_density
 
             # Aggregate Apparent Volume (adjusted by moisture correction)
-            fine_loose_bulk_density = self.fine_agg.loose_bulk_density
-            coarse_loose_bulk_density = self.coarse_agg.loose_bulk_density
+            fine_loose_bulk_density = fine_agg.loose_bulk_density
+            coarse_loose_bulk_density = coarse_agg.loose_bulk_density
 
-            fine_volume = self.fine_agg.apparent_volume(fine_content_wet, fine_loose_bulk_density, "fine")
-            coarse_volume = self.coarse_agg.apparent_volume(coarse_content_wet, coarse_loose_bulk_density, "coarse")
+            fine_volume = fine_agg.apparent_volume(fine_content_wet, fine_loose_bulk_density, "fine")
+            coarse_volume = coarse_agg.apparent_volume(coarse_content_wet, coarse_loose_bulk_density, "coarse")
 
             # Admixture dosage
-            wra_relative_density = self.wra.relative_density
-            wra_dosage = self.wra.dosage
-            aea_checked = self.aea.aea_checked
-            aea_relative_density = self.aea.relative_density
-            aea_dosage = self.aea.dosage
+            wra_relative_density = wra.relative_density
+            wra_dosage = wra.dosage
+            aea_checked = aea.aea_checked
+            aea_relative_density = aea.relative_density
+            aea_dosage = aea.dosage
             total_cementitious_content = cement_content + scm_content
 
             # Water-Reducing Admixture
             if wra_checked:
-                wra_content = self.wra.admixture_content(total_cementitious_content, wra_dosage)
-                wra_volume = self.wra.admixture_volume(wra_content, water_density, wra_relative_density)
+                wra_content = wra.admixture_content(total_cementitious_content, wra_dosage)
+                wra_volume = wra.admixture_volume(wra_content, water_density, wra_relative_density)
             else:
                 wra_content = None
                 wra_volume = None
 
             # Air-Entraining Admixture
             if aea_checked:
-                aea_content = self.wra.admixture_content(total_cementitious_content, aea_dosage)
-                aea_volume = self.wra.admixture_volume(aea_content, water_density, aea_relative_density)
+                aea_content = wra.admixture_content(total_cementitious_content, aea_dosage)
+                aea_volume = wra.admixture_volume(aea_content, water_density, aea_relative_density)
             else:
                 aea_content = None
                 aea_volume = None
@@ -1006,34 +1221,24 @@ class ACI:
             fine_abs_volume = 1000 * fine_abs_volume
             coarse_abs_volume = 1000 * coarse_abs_volume
             scm_abs_volume = 1000 * scm_abs_volume
-            if entrained_air:
-                entrained_air_content = 1000 * entrained_air_content
-            else:
-                entrapped_air_content = 1000 * entrapped_air_content
+            air_volume = 1000 * (entrained_air_content if entrained_air else entrapped_air_content)
             if wra_checked:
                 wra_volume = 1000 * wra_volume
             if aea_checked:
                 aea_volume = 1000 * aea_volume
 
             # Add up all absolute volumes and contents
-            if entrained_air:
-                total_abs_volume = sum(
-                    [water_abs_volume, cement_abs_volume, scm_abs_volume, fine_abs_volume, coarse_abs_volume,
-                     entrained_air_content])
-            else:
-                total_abs_volume = sum(
-                    [water_abs_volume, cement_abs_volume, scm_abs_volume, fine_abs_volume, coarse_abs_volume,
-                     entrapped_air_content])
-
-            total_content = sum(
-                [water_content_correction, cement_content, scm_content, fine_content_wet, coarse_content_wet])
+            total_abs_volume = sum((water_abs_volume, cement_abs_volume, scm_abs_volume, fine_abs_volume,
+                                    coarse_abs_volume, air_volume))
+            total_content = sum((water_content_correction, cement_content, scm_content, fine_content_wet,
+                                 coarse_content_wet))
 
             # Store all the results in a dictionary
             self.calculation_results = {
                 "target_strength_value": target_strength,
                 "w_cm": w_cm,
-                "entrapped_air_content": entrapped_air_content if not entrained_air else None,
-                "entrained_air_content": entrained_air_content if entrained_air else None,
+                "entrapped_air_content": air_volume if not entrained_air else None,
+                "entrained_air_content": air_volume if entrained_air else None,
                 "final_content": water_content,
                 "water_content_correction": water_content_correction,
                 "water_abs_volume": water_abs_volume,
@@ -1060,10 +1265,14 @@ class ACI:
                 "total_content": total_content
             }
 
-            self.logger.info(f"Calculations completed successfully")
+            self.logger.info("Calculations completed successfully")
             return True
 
-        except Exception: # Capturing all exceptions to ensure robust calculation process
+        except (ValueError, ZeroDivisionError, KeyError) as e:
+            # Expected design errors, already reported by the components to the ACI data model
+            self.logger.error("Error during calculations: %s", e)
+            return False
+        except Exception: # Any other exception is unexpected, so the full traceback is logged
             self.logger.error("Error during calculations", exc_info=True)
             return False
 
@@ -1076,36 +1285,10 @@ class ACI:
             self.logger.error("No calculation results to update in the data model")
             return
 
-        for key, value in self.calculation_results.items():
-            # The key paths according to ACI data model schema
-            if key == "target_strength_value":
-                data_key = "spec_strength.target_strength.target_strength_value"
-            elif key == "w_cm":
-                data_key = "water_cementitious_materials_ratio.w_cm"
-            elif key in ("entrapped_air_content", "entrained_air_content"):
-                data_key = f"air.{key}"
-            elif key == "final_content":
-                data_key = f"water.water_content.{key}"
-            elif key in ("water_content_correction", "water_abs_volume", "water_volume"):
-                data_key = f"water.{key}"
-            elif key in ("cement_content", "cement_abs_volume", "cement_volume"):
-                data_key = f"cementitious_material.cement.{key}"
-            elif key in ("scm_content", "scm_abs_volume", "scm_volume"):
-                data_key = f"cementitious_material.scm.{key}"
-            elif key in ("fine_content_ssd", "fine_content_wet", "fine_abs_volume", "fine_volume"):
-                data_key = f"fine_aggregate.{key}"
-            elif key in ("coarse_content_ssd", "coarse_content_wet", "coarse_abs_volume", "coarse_volume"):
-                data_key = f"coarse_aggregate.{key}"
-            elif key in ("WRA_content", "WRA_volume"):
-                data_key = f"chemical_admixtures.WRA.{key}"
-            elif key in ("AEA_content", "AEA_volume"):
-                data_key = f"chemical_admixtures.AEA.{key}"
-            elif key in ("total_abs_volume", "total_content"):
-                data_key = f"summation.{key}"
-            else:
-                continue
-
-            self.aci_data_model.update_data(data_key, value)
+        # The key paths according to the ACI data model schema, written in a single batch.
+        # None results are written too, so that values from a previous run are cleared
+        results = self.calculation_results
+        self.aci_data_model.update_many({path: results[key] for key, path in _RESULT_PATHS.items()})
         self.logger.debug("ACI data model updated with calculation results")
 
     def run(self):
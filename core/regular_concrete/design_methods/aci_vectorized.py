@@ -0,0 +1,465 @@
+"""
+Vectorized (NumPy) versions of the ACI mix-design arithmetic.
+
+The classes in aci.py work on a single mix at a time and record every intermediate value in the ACI data model,
+which is what the GUI needs. For parameter studies (sweeping w/cm, slump, NMS, strengths...), the functions in this
+module evaluate the same equations on whole arrays at once, without Python-level dispatch per sample and without
+touching any data model.
+"""
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from settings import (NMS_VALID, MIN_CEMENTITIOUS_CONTENT_ACI, ENTRAPPED_AIR, ENTRAINED_AIR, COEFFICIENTS,
+                      WATER_CONTENT_NAE, WATER_CONTENT_AE, WATER_REDUCTION_SCM_ACI, MAX_W_CM_ACI, K_FACTOR, QUARTILES,
+                      CONVERSION_FACTORS)
+
+# Integer code of each nominal maximum size valid for the ACI method, used to index the tables below
+NMS_CODES = {nms: code for code, nms in enumerate(NMS_VALID["ACI"])}
+
+# Tables indexed by NMS code
+MIN_CEMENTITIOUS_CONTENT = np.array([MIN_CEMENTITIOUS_CONTENT_ACI.get(nms, 0) for nms in NMS_VALID["ACI"]],
+                                    dtype=np.float64) # 0 where the NMS has no minimum
+ENTRAPPED_AIR_FRACTION = np.array([ENTRAPPED_AIR[nms] / 100 for nms in NMS_VALID["ACI"]], dtype=np.float64)
+COEFFICIENT_A = np.array([COEFFICIENTS[nms]['a'] for nms in NMS_VALID["ACI"]], dtype=np.float64)
+COEFFICIENT_B = np.array([COEFFICIENTS[nms]['b'] for nms in NMS_VALID["ACI"]], dtype=np.float64)
+
+# Integer code of each slump range of the water content tables
+SLUMP_CODES = {slump_range: code for code, slump_range in enumerate(WATER_CONTENT_NAE)}
+
+# Base water content indexed by [entrained air (0 or 1), slump code, NMS code]
+WATER_CONTENT = np.array([[[table[slump_range][nms] for nms in NMS_VALID["ACI"]] for slump_range in SLUMP_CODES]
+                          for table in (WATER_CONTENT_NAE, WATER_CONTENT_AE)], dtype=np.float64)
+
+
+@dataclass(slots=True)
+class AggregateArrays:
+    """
+    Numeric properties of many aggregates stored as one contiguous array per property (structure of arrays),
+    so that the batch functions below read each property of every sample in a single pass.
+    """
+
+    relative_density: np.ndarray
+    loose_bulk_density: np.ndarray
+    compacted_bulk_density: np.ndarray
+    moisture_content: np.ndarray
+    moisture_absorption: np.ndarray
+
+    @classmethod
+    def from_samples(cls, samples):
+        """
+        Pack the properties of a sequence of aggregates (e.g., aci.CoarseAggregate instances) into arrays.
+
+        :param Sequence samples: Objects with the attributes named as the fields of this class.
+        :return: The packed properties.
+        :rtype: AggregateArrays
+        """
+
+        return cls(*(np.fromiter((getattr(sample, prop.name) for sample in samples), dtype=np.float64,
+                                 count=len(samples))
+                     for prop in fields(cls)))
+
+    @classmethod
+    def from_designs(cls, designs, aggregate):
+        """
+        Pack the properties of an aggregate from a sequence of design data dictionaries.
+
+        :param Sequence[dict] designs: Design data of each mix (see RegularConcreteDataModel.design_data).
+        :param str aggregate: The aggregate to pack, 'fine_aggregate' or 'coarse_aggregate'.
+        :return: The packed properties.
+        :rtype: AggregateArrays
+        """
+
+        key_paths = ('physical_prop.relative_density_SSD', 'physical_prop.PUS', 'physical_prop.PUC',
+                     'moisture.moisture_content', 'moisture.absorption_content')
+
+        return cls(*(_column(designs, f"{aggregate}.{key_path}") for key_path in key_paths))
+
+
+def _values(designs, key_path):
+    """Get the value at a dotted key path of each design data dictionary."""
+
+    keys = key_path.split('.')
+    values = []
+    for design in designs:
+        for key in keys:
+            design = design[key]
+        values.append(design)
+
+    return values
+
+
+def _column(designs, key_path, dtype=np.float64):
+    """Get the value at a dotted key path of each design data dictionary, as an array (None becomes NaN or False)."""
+
+    return np.array(_values(designs, key_path), dtype=dtype)
+
+
+def nms_to_codes(nms_values):
+    """
+    Convert nominal maximum sizes into their integer codes.
+
+    :param list[str] nms_values: The nominal maximum sizes of the coarse aggregate.
+    :return: An array with the integer code of each NMS.
+    :rtype: np.ndarray
+    """
+
+    try:
+        return np.array([NMS_CODES[nms] for nms in nms_values], dtype=np.intp)
+    except KeyError as e:
+        raise ValueError(f"The NMS ({e.args[0]}) is not valid. Valid NMS values are: {list(NMS_CODES)}") from None
+
+
+def slump_to_codes(slump_ranges):
+    """
+    Convert slump ranges into their integer codes.
+
+    :param list[str] slump_ranges: The slump ranges of the concrete in fresh state.
+    :return: An array with the integer code of each slump range.
+    :rtype: np.ndarray
+    """
+
+    try:
+        return np.array([SLUMP_CODES[slump_range] for slump_range in slump_ranges], dtype=np.intp)
+    except KeyError as e:
+        raise ValueError(f"The slump range ({e.args[0]}) is not valid. "
+                         f"Valid slump ranges are: {list(SLUMP_CODES)}") from None
+
+
+def water_content(slump_codes, nms_codes, entrained_air, coarse_rounded=False, fine_manufactured=False,
+                  scm_reduction=0, scm_percentage=0, wra_reduction=0):
+    """
+    Calculate the required water content for arrays of mixes.
+
+    :param np.ndarray slump_codes: The slump range integer codes (see slump_to_codes).
+    :param np.ndarray nms_codes: The NMS integer codes (see nms_to_codes).
+    :param np.ndarray entrained_air: True for air-entrained mixes, otherwise False.
+    :param np.ndarray coarse_rounded: True where the coarse aggregate is rounded.
+    :param np.ndarray fine_manufactured: True where the fine aggregate is manufactured.
+    :param np.ndarray scm_reduction: Water reduction (in percentage) for every 10 % of SCM (see WATER_REDUCTION_SCM_ACI).
+    :param np.ndarray scm_percentage: Percentage of total cementitious material that is SCM (0 if not used).
+    :param np.ndarray wra_reduction: Water reduction of the WRA in percentage (0 if it does not reduce the water).
+    :return: A tuple containing the water contents and their WRA corrections (in kg/m³).
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+
+    base = WATER_CONTENT[np.asarray(entrained_air, dtype=np.intp), slump_codes, nms_codes]
+
+    correction_coarse = np.where(coarse_rounded, -0.08 * base, 0)
+    correction_fine = np.where(fine_manufactured, 0.05 * base, 0)
+    correction_scm = -((np.asarray(scm_percentage) // 10 * scm_reduction) * 0.01) * base
+    correction_wra = -(np.asarray(wra_reduction, dtype=np.float64) / 100) * base
+
+    return base + correction_coarse + correction_fine + correction_scm + correction_wra, correction_wra
+
+
+def target_strength_unknown(design_strength):
+    """
+    Calculate the target strength for arrays of mixes whose standard deviation is unknown (predefined margins).
+
+    :param np.ndarray design_strength: The design strengths in MPa.
+    :return: The target strength of each mix (in MPa).
+    :rtype: np.ndarray
+    """
+
+    design_strength = np.asarray(design_strength, dtype=np.float64)
+
+    return np.where(design_strength < 21, design_strength + 7.0,
+                    np.where(design_strength <= 35, design_strength + 8.3, 1.10 * design_strength + 5.0))
+
+
+def w_cm_by_strength(target_strength, entrained_air):
+    """
+    Calculate the water-to-cementitious materials ratio (w/cm) based on Abrams' Law for arrays of mixes.
+
+    :param np.ndarray target_strength: The target compressive strengths in MPa.
+    :param np.ndarray entrained_air: True for air-entrained mixes, otherwise False (broadcastable).
+    :return: The w/cm ratio by strength of each mix.
+    :rtype: np.ndarray
+    """
+
+    target_strength = np.asarray(target_strength, dtype=np.float64)
+
+    # Both curves are evaluated over the whole array and selected without branching (no boolean-mask gathers)
+    return np.where(entrained_air, -0.368 * np.log(target_strength) + 1.7,
+                    1.1318 * np.exp(-0.025 * target_strength))
+
+
+def cementitious_content(water_content, w_cm, nms_codes, scm_percentage=0):
+    """
+    Calculate the cement and SCM contents for arrays of mixes.
+
+    :param np.ndarray water_content: The water contents in kg/m³.
+    :param np.ndarray w_cm: The water-to-cementitious materials ratios.
+    :param np.ndarray nms_codes: The NMS integer codes (see nms_to_codes).
+    :param np.ndarray scm_percentage: Percentage of total cementitious material that is SCM (0 if not used).
+    :return: A tuple containing the cement contents and SCM contents (in kg/m³).
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+
+    water_content = np.asarray(water_content, dtype=np.float64)
+    final_content = np.maximum(water_content / w_cm, MIN_CEMENTITIOUS_CONTENT[nms_codes])
+
+    scm_content = final_content * (np.asarray(scm_percentage, dtype=np.float64) / 100)
+    cement_content = final_content - scm_content
+
+    return cement_content, scm_content
+
+
+def coarse_content(nms_codes, fineness_modulus, compacted_bulk_density, absorption):
+    """
+    Calculate the coarse aggregate content (SSD) for arrays of mixes.
+
+    :param np.ndarray nms_codes: The NMS integer codes (see nms_to_codes).
+    :param np.ndarray fineness_modulus: Fineness modulus of the fine aggregate.
+    :param np.ndarray compacted_bulk_density: Compacted bulk density of the coarse aggregate in kg/m³.
+    :param np.ndarray absorption: Absorption of the coarse aggregate in percentage.
+    :return: The mass of SSD coarse aggregate for a cubic meter of concrete in kg, for each mix.
+    :rtype: np.ndarray
+    """
+
+    bulk_volume = COEFFICIENT_A[nms_codes] * fineness_modulus + COEFFICIENT_B[nms_codes]
+
+    return bulk_volume * compacted_bulk_density * (1 + np.asarray(absorption, dtype=np.float64) / 100)
+
+
+def content_moisture_correction(ssd_content, moisture_content, absorption):
+    """
+    Adjust arrays of aggregate contents from an SSD (saturated surface-dry) condition to a wet condition.
+
+    :param np.ndarray ssd_content: Aggregate contents under SSD conditions.
+    :param np.ndarray moisture_content: Moisture contents of the aggregates as a percentage.
+    :param np.ndarray absorption: Absorption capacities of the aggregates as a percentage.
+    :return: Adjusted aggregate contents under wet conditions.
+    :rtype: np.ndarray
+    """
+
+    return ssd_content * ((100 + np.asarray(moisture_content, dtype=np.float64)) / (100 + absorption))
+
+
+def fine_content(water_volume, air_volume, cement_abs_volume, scm_abs_volume, coarse_abs_volume,
+                 fine_relative_density, water_density):
+    """
+    Calculate the fine aggregate content (SSD) for arrays of mixes using the absolute volume method.
+
+    Mixes where the other components already fill one cubic meter get NaN instead of raising an error.
+
+    :param np.ndarray water_volume: Volumes of water (in m³).
+    :param np.ndarray air_volume: Volumes of air (in m³).
+    :param np.ndarray cement_abs_volume: Absolute volumes of cement (in m³).
+    :param np.ndarray scm_abs_volume: Absolute volumes of SCM (in m³).
+    :param np.ndarray coarse_abs_volume: Absolute volumes of coarse aggregate (in m³).
+    :param np.ndarray fine_relative_density: Fine aggregate relative densities (SSD).
+    :param np.ndarray water_density: Water densities in kg/m³.
+    :return: The mass of SSD fine aggregate for a cubic meter of concrete in kg, for each mix.
+    :rtype: np.ndarray
+    """
+
+    fine_abs_volume = 1 - (np.asarray(water_volume, dtype=np.float64) + air_volume + cement_abs_volume +
+                           scm_abs_volume + coarse_abs_volume)
+    fine_abs_volume = np.where(fine_abs_volume > 0, fine_abs_volume, np.nan)
+
+    return fine_abs_volume * fine_relative_density * water_density
+
+
+def target_strength_known(design_strength, std_dev_value, k_factor, z_value):
+    """
+    Calculate the target strength for arrays of mixes whose standard deviation is known (sample size >= 15).
+
+    :param np.ndarray design_strength: The design strengths in MPa.
+    :param np.ndarray std_dev_value: The standard deviations in MPa.
+    :param np.ndarray k_factor: The k-factors for the number of tests (see K_FACTOR).
+    :param np.ndarray z_value: The z values for the defective levels (see QUARTILES).
+    :return: The target strength of each mix (in MPa).
+    :rtype: np.ndarray
+    """
+
+    design_strength = np.asarray(design_strength, dtype=np.float64)
+    spread = k_factor * np.asarray(std_dev_value, dtype=np.float64)
+
+    f_cr_1 = design_strength - z_value * spread
+    f_cr_2 = np.where(design_strength <= 35,
+                      design_strength - (z_value - 1) * spread - 3.5,
+                      0.9 * design_strength - (z_value - 1) * spread)
+
+    return np.maximum(f_cr_1, f_cr_2)
+
+
+def mix_contents(water_content, w_cm, nms_codes, fineness_modulus, air_volume, cement_relative_density, fine_agg,
+                 coarse_agg, water_density=1000, scm_percentage=0, scm_relative_density=None):
+    """
+    Calculate the SSD contents of a batch of mixes in one pass, chaining the functions above
+    (cementitious, coarse and fine contents by the absolute volume method).
+
+    :param np.ndarray water_content: The water contents in kg/m³.
+    :param np.ndarray w_cm: The water-to-cementitious materials ratios.
+    :param np.ndarray nms_codes: The NMS integer codes (see nms_to_codes).
+    :param np.ndarray fineness_modulus: Fineness modulus of the fine aggregate.
+    :param np.ndarray air_volume: Volumes of air (in m³).
+    :param np.ndarray cement_relative_density: Relative densities of the cement.
+    :param AggregateArrays fine_agg: Properties of the fine aggregate of each mix.
+    :param AggregateArrays coarse_agg: Properties of the coarse aggregate of each mix.
+    :param np.ndarray water_density: Water densities in kg/m³.
+    :param np.ndarray scm_percentage: Percentage of total cementitious material that is SCM (0 if not used).
+    :param np.ndarray scm_relative_density: Relative densities of the SCM (None if no SCM is used).
+    :return: A tuple containing the cement, SCM, fine aggregate (SSD) and coarse aggregate (SSD) contents (in kg/m³).
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    """
+
+    water_content = np.asarray(water_content, dtype=np.float64)
+
+    cement, scm = cementitious_content(water_content, w_cm, nms_codes, scm_percentage)
+    coarse = coarse_content(nms_codes, fineness_modulus, coarse_agg.compacted_bulk_density,
+                            coarse_agg.moisture_absorption)
+
+    scm_abs_volume = 0 if scm_relative_density is None else scm / (scm_relative_density * water_density)
+    fine = fine_content(water_content / water_density, air_volume, cement / (cement_relative_density * water_density),
+                        scm_abs_volume, coarse / (coarse_agg.relative_density * water_density),
+                        fine_agg.relative_density, water_density)
+
+    return cement, scm, fine, coarse
+
+
+def run_batch(designs, units="SI"):
+    """
+    Run the ACI method for a batch of designs at once.
+
+    The design data of every mix is packed into arrays and the whole calculation sequence of ACI.perform_calculations
+    is evaluated on those arrays. Instead of raising an error, the mixes whose fine aggregate volume is not positive
+    get NaN contents.
+
+    :param Sequence[dict] designs: Design data of each mix (see RegularConcreteDataModel.design_data).
+    :param str units: Unit system of the design data ("SI" or "MKS").
+    :return: The results of each mix, with the keys of ACI.calculation_results (volumes in liters).
+    :rtype: dict[str, np.ndarray]
+    """
+
+    # A. Target Strength
+    factor = CONVERSION_FACTORS[units]["stress"] if units == "MKS" else 1
+    design_strength = _column(designs, 'field_requirements.strength.spec_strength') * factor
+    std_dev_value = _column(designs, 'field_requirements.strength.std_dev_known.std_dev_value') * factor
+    sample_size = _values(designs, 'field_requirements.strength.std_dev_known.test_nro')
+    std_dev_known = (_column(designs, 'field_requirements.strength.std_dev_known.std_dev_known_enabled', bool) &
+                     (np.array(sample_size, dtype=np.float64) >= 15))
+    std_dev_unknown = _column(designs, 'field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled', bool)
+
+    k_factor = np.array([K_FACTOR.get(size, 1.00) for size in sample_size])
+    z_value = np.array([QUARTILES.get(level, np.nan)
+                        for level in _values(designs, 'field_requirements.strength.std_dev_known.defective_level')])
+    target_strength = np.where(std_dev_known, target_strength_known(design_strength, std_dev_value, k_factor, z_value),
+                               np.where(std_dev_unknown, target_strength_unknown(design_strength), np.nan))
+
+    # B. Water Content and Absolute Volume
+    nms = _values(designs, 'coarse_aggregate.NMS')
+    nms_codes = nms_to_codes(nms)
+    entrained_air = _column(designs, 'field_requirements.entrained_air_content.is_checked', bool)
+    scm_checked = _column(designs, 'cementitious_materials.SCM.SCM_checked', bool)
+    scm_percentage = np.where(scm_checked, _column(designs, 'cementitious_materials.SCM.SCM_content'), 0)
+    wra_checked = _column(designs, 'chemical_admixtures.WRA.WRA_checked', bool)
+    wra_water_reducer = _column(designs, 'chemical_admixtures.WRA.WRA_action.water_reducer', bool)
+    wra_cement_economizer = _column(designs, 'chemical_admixtures.WRA.WRA_action.cement_economizer', bool)
+    water_density = _column(designs, 'water.water_density')
+
+    water, water_correction_wra = water_content(
+        slump_to_codes(_values(designs, 'field_requirements.slump_range')), nms_codes, entrained_air,
+        coarse_rounded=[agg_type == "Redondeada" for agg_type in _values(designs, 'coarse_aggregate.info.type')],
+        fine_manufactured=[agg_type == "Manufacturada" for agg_type in _values(designs, 'fine_aggregate.info.type')],
+        scm_reduction=np.where(scm_checked, [WATER_REDUCTION_SCM_ACI.get(scm_type, 0) for scm_type in
+                                             _values(designs, 'cementitious_materials.SCM.SCM_type')], 0),
+        scm_percentage=scm_percentage,
+        wra_reduction=np.where(wra_checked & (wra_cement_economizer | wra_water_reducer),
+                               _column(designs, 'chemical_admixtures.WRA.WRA_effectiveness'), 0)
+    )
+    water_abs_volume = water / water_density
+
+    # C. Water-Cementitious Materials ratio (the most restrictive exposure class governs the durability limit)
+    exposure_classes = _values(designs, 'validation.exposure_classes')
+    w_cm_by_durability = np.array([min([1.0, *(MAX_W_CM_ACI.get(exposure_class, 1.0)
+                                               for exposure_class in classes.values())])
+                                   for classes in exposure_classes])
+    w_cm = np.minimum(w_cm_by_strength(target_strength, entrained_air), w_cm_by_durability)
+
+    # D. Cementitious Materials Content and Absolute Volume (the water reduced by a pure water reducer is not used)
+    water_for_cementitious = np.where(wra_checked & wra_water_reducer, water - water_correction_wra, water)
+    cement, scm = cementitious_content(water_for_cementitious, w_cm, nms_codes, scm_percentage)
+    cement_abs_volume = cement / (_column(designs, 'cementitious_materials.cement_relative_density') * water_density)
+    scm_abs_volume = np.where(scm_checked, scm / (_column(designs, 'cementitious_materials.SCM.SCM_relative_density')
+                                                  * water_density), 0)
+    w_cm = water / (cement + scm)
+
+    # E. Air Content
+    exposure_defined = _values(designs, 'field_requirements.entrained_air_content.exposure_defined')
+    user_defined = _values(designs, 'field_requirements.entrained_air_content.user_defined')
+    entrained_air_fraction = np.zeros(len(designs))
+    for i in np.flatnonzero(entrained_air):
+        if exposure_defined[i]:
+            freezing_class = next((exposure_class for exposure_class in exposure_classes[i].values()
+                                   if exposure_class in ENTRAINED_AIR["ACI"]), None)
+            if freezing_class is not None:
+                entrained_air_fraction[i] = ENTRAINED_AIR["ACI"][freezing_class][nms[i]] / 100
+        else:
+            entrained_air_fraction[i] = user_defined[i] / 100
+    air_volume = np.where(entrained_air, entrained_air_fraction, ENTRAPPED_AIR_FRACTION[nms_codes])
+
+    # F. Coarse Content and Absolute Volume
+    fine_agg = AggregateArrays.from_designs(designs, 'fine_aggregate')
+    coarse_agg = AggregateArrays.from_designs(designs, 'coarse_aggregate')
+    coarse_ssd = coarse_content(nms_codes, _column(designs, 'fine_aggregate.fineness_modulus'),
+                                coarse_agg.compacted_bulk_density, coarse_agg.moisture_absorption)
+    coarse_abs_volume = coarse_ssd / (coarse_agg.relative_density * water_density)
+
+    # G. Fine Content and Absolute Volume
+    fine_ssd = fine_content(water_abs_volume, air_volume, cement_abs_volume, scm_abs_volume, coarse_abs_volume,
+                            fine_agg.relative_density, water_density)
+    fine_abs_volume = fine_ssd / (fine_agg.relative_density * water_density)
+
+    # Moisture adjustments
+    fine_wet = content_moisture_correction(fine_ssd, fine_agg.moisture_content, fine_agg.moisture_absorption)
+    coarse_wet = content_moisture_correction(coarse_ssd, coarse_agg.moisture_content, coarse_agg.moisture_absorption)
+    water_correction = water + (fine_ssd - fine_wet) + (coarse_ssd - coarse_wet)
+
+    # Admixture dosage (NaN where the admixture is not used)
+    total_cementitious = cement + scm
+    wra_content = np.where(wra_checked, total_cementitious *
+                           (_column(designs, 'chemical_admixtures.WRA.WRA_dosage') / 100), np.nan)
+    aea_checked = _column(designs, 'chemical_admixtures.AEA.AEA_checked', bool)
+    aea_content = np.where(aea_checked, total_cementitious *
+                           (_column(designs, 'chemical_admixtures.AEA.AEA_dosage') / 100), np.nan)
+    wra_volume = wra_content / (_column(designs, 'chemical_admixtures.WRA.WRA_relative_density') * water_density)
+    aea_volume = aea_content / (_column(designs, 'chemical_admixtures.AEA.AEA_relative_density') * water_density)
+
+    # Convert absolute volumes from m³ to L
+    volumes = 1000 * np.array([water_abs_volume, water_correction / water_density, cement_abs_volume, scm_abs_volume,
+                               fine_abs_volume, coarse_abs_volume, air_volume, wra_volume, aea_volume])
+    (water_abs_volume, water_volume, cement_abs_volume, scm_abs_volume, fine_abs_volume, coarse_abs_volume, air_volume,
+     wra_volume, aea_volume) = volumes
+
+    return {
+        "target_strength_value": target_strength,
+        "w_cm": w_cm,
+        "entrapped_air_content": np.where(entrained_air, np.nan, air_volume),
+        "entrained_air_content": np.where(entrained_air, air_volume, np.nan),
+        "final_content": water,
+        "water_content_correction": water_correction,
+        "water_abs_volume": water_abs_volume,
+        "water_volume": water_volume,
+        "cement_content": cement,
+        "cement_abs_volume": cement_abs_volume,
+        "scm_content": np.where(scm_checked, scm, np.nan),
+        "scm_abs_volume": np.where(scm_checked, scm_abs_volume, np.nan),
+        "fine_content_ssd": fine_ssd,
+        "fine_content_wet": fine_wet,
+        "fine_abs_volume": fine_abs_volume,
+        "fine_volume": 1000 * fine_wet / fine_agg.loose_bulk_density,
+        "coarse_content_ssd": coarse_ssd,
+        "coarse_content_wet": coarse_wet,
+        "coarse_abs_volume": coarse_abs_volume,
+        "coarse_volume": 1000 * coarse_wet / coarse_agg.loose_bulk_density,
+        "WRA_content": wra_content,
+        "WRA_volume": wra_volume,
+        "AEA_content": aea_content,
+        "AEA_volume": aea_volume,
+        "total_abs_volume": (water_abs_volume + cement_abs_volume + scm_abs_volume + fine_abs_volume +
+                             coarse_abs_volume + air_volume),
+        "total_content": water_correction + cement + scm + fine_wet + coarse_wet,
+    }
@@ -1,7 +1,9 @@
+import math
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
+from functools import lru_cache
 
-import numpy as np
-from numpy.polynomial import Polynomial
+from numpy.polynomial.polynomial import polyroots, polyval
 
 from core.regular_concrete.models.regular_concrete_data_model import RegularConcreteDataModel
 from core.regular_concrete.models.doe_data_model import DOEDataModel
@@ -10,13 +12,151 @@ from settings import (QUARTILES, CONVERSION_FACTORS, W_CM_COEFFICIENTS, STARTING
                       WATER_CONTENT_REDUCTION, MIN_CEMENTITIOUS_CONTENT_DOE, ENTRAINED_AIR, DENSITY_COEFFICIENTS,
                       FINE_PROPORTION)
 
+# Lookup tables flattened at import time, so that each value is found with a single hash lookup
+_WATER_CONTENT = {
+    (nms, agg_type, slump_range): value
+    for nms, table in WATER_CONTENT.items()
+    for agg_type, row in table.items()
+    for slump_range, value in row.items()
+} # Key: (nms, agg_type, slump_range)
+_WATER_CONTENT_REDUCTION = {
+    (scm_percentage_range, slump_range): value
+    for scm_percentage_range, row in WATER_CONTENT_REDUCTION.items()
+    for slump_range, value in row.items()
+} # Key: (scm_percentage_range, slump_range)
+
+# Slump ranges in ascending order (with the position of each one), and the SCM percentage ranges of each ten percent
+# (from 10 %)
+_SLUMP_RANGES = ("0 mm - 10 mm", "10 mm - 30 mm", "30 mm - 60 mm", "60 mm - 180 mm")
+_SLUMP_INDEX = {slump_range: index for index, slump_range in enumerate(_SLUMP_RANGES)}
+_SCM_PERCENTAGE_RANGES = ('10-20', '20-30', '30-40', '40-50', '50')
+
+# Relative densities of the wet density lines, sorted at import time for the interpolation
+_DENSITY_KEYS = tuple(sorted(DENSITY_COEFFICIENTS))
+# Percentages passing the 600 µm sieve of the fine proportion lines, in ascending order
+_PASSING_600_KEYS = (15, 40, 60, 80, 100)
+
+# Minimum standard deviation when it is known, by (Curve A: fewer than 20 samples, design strength <= 20 MPa):
+# a fraction of the design strength up to 20 MPa, a value in MPa above it
+_MIN_STD_DEV = {(True, True): 0.4, (True, False): 8, (False, True): 0.2, (False, False): 4}
+
+# Coefficients of the third degree w/cm curves, one row per curve (from the lowest curve to the highest) in ascending
+# order, and their strengths at the starting w/cm of 0.50
+_W_CM_COEFFICIENTS = tuple(tuple(float(c) for c in coefficients) for coefficients in W_CM_COEFFICIENTS.values())
+# (all the curves in a single polyval call, one column of coefficients per curve)
+_W_CM_CURVES_AT_HALF = tuple(polyval(0.5, tuple(zip(*_W_CM_COEFFICIENTS))).tolist())
+# Difference between each pair of consecutive curves, in coefficients and in strength at 0.50
+_W_CM_COEFFICIENT_STEPS = tuple(tuple(u - l for l, u in zip(lower, upper))
+                                for lower, upper in zip(_W_CM_COEFFICIENTS, _W_CM_COEFFICIENTS[1:]))
+_W_CM_STEPS_AT_HALF = tuple(upper - lower for lower, upper in zip(_W_CM_CURVES_AT_HALF, _W_CM_CURVES_AT_HALF[1:]))
+
+
+@lru_cache(maxsize=256)
+def _min_cementitious_content(exposure_classes):
+    """
+    Minimum cementitious content required by the most demanding exposure class (exposure_classes must be a tuple).
+
+    :return: The minimum cementitious content (in kg/m³), 0 if no exposure class requires it.
+    :rtype: int
+    """
+
+    return max(MIN_CEMENTITIOUS_CONTENT_DOE.get(exposure_class, 0) for exposure_class in exposure_classes)
+
+
+@lru_cache(maxsize=256)
+def _max_w_cm_by_durability(exposure_classes):
+    """
+    Maximum w/cm allowed by the most demanding exposure class (exposure_classes must be a tuple).
+
+    :return: The maximum w/cm ratio, 1.0 if no exposure class limits it.
+    :rtype: float
+    """
+
+    return min(MAX_W_CM_DOE.get(exposure_class, 1.0) for exposure_class in exposure_classes)
+
+
+@lru_cache(maxsize=256)
+def _entrained_air_fraction(exposure_classes):
+    """
+    Pure form of Air.entrained_air_volume (exposure_classes must be a tuple).
+
+    :return: The entrained air volume in m³, or 0 if no air entrainment is required.
+    :rtype: float
+    """
+
+    # Only the freezing-and-thawing classes that require air entrainment are in the table
+    air_content_table = ENTRAINED_AIR["DoE"]
+    max_value = max([0, *(air_content_table[exposure_class] for exposure_class in exposure_classes
+                          if exposure_class in air_content_table)])
+
+    # Convert percentage to fraction
+    return max_value / 100
+
+
+def _cubic_real_roots(coefficients, imag_tol=1e-7):
+    """
+    Real roots of the cubic c0 + c1·x + c2·x² + c3·x³, in closed form (trigonometric method for three real roots,
+    Cardano's formula for one), polished with Newton's method on the original polynomial.
+
+    As with the eigenvalues of the companion matrix, a complex pair whose imaginary part is below imag_tol counts as
+    real. When the cubic term is negligible the normalization is ill-conditioned, so polyroots is used instead.
+
+    :param Sequence[float] coefficients: The coefficients in ascending order (c0, c1, c2, c3).
+    :param float imag_tol: The largest imaginary part of a root considered real.
+    :return: The real roots in ascending order.
+    :rtype: list[float]
+    """
+
+    c0, c1, c2, c3 = (float(c) for c in coefficients)
+    if abs(c3) <= 1e-6 * max(abs(c0), abs(c1), abs(c2)):
+        return sorted(r.real for r in polyroots(coefficients) if abs(r.imag) < imag_tol)
+
+    # Monic form x³ + b·x² + c·x + d, depressed as t³ + p·t + q with x = t - b/3
+    b, c, d = c2 / c3, c1 / c3, c0 / c3
+    shift = b / 3
+    p = c - b * shift
+    q = 2 * b * b * b / 27 - b * c / 3 + d
+    half_q, third_p = q / 2, p / 3
+    discriminant = half_q * half_q + third_p * third_p * third_p
+
+    if discriminant > 0:
+        # One real root and a complex pair (-(u + v)/2 - b/3 ± i·√3/2·(u - v))
+        sqrt_discriminant = math.sqrt(discriminant)
+        u = math.cbrt(-half_q + sqrt_discriminant)
+        v = math.cbrt(-half_q - sqrt_discriminant)
+        roots = [u + v - shift]
+        if math.sqrt(3) / 2 * abs(u - v) < imag_tol:
+            roots.append(-(u + v) / 2 - shift)
+    elif p == 0:
+        # Triple root
+        roots = [-shift]
+    else:
+        # Three real roots
+        r = 2 * math.sqrt(-third_p)
+        theta = math.acos(max(-1.0, min(1.0, 3 * q / (p * r)))) / 3
+        roots = [r * math.cos(theta - 2 * math.pi * k / 3) - shift for k in range(3)]
+
+    polished = []
+    for x in roots:
+        for _ in range(2):
+            derivative = (3 * c3 * x + 2 * c2) * x + c1
+            if derivative == 0:
+                break
+            x -= (((c3 * x + c2) * x + c1) * x + c0) / derivative
+        polished.append(x)
+
+    return sorted(polished)
+
 
 # ------------------------------------------------ Class for materials ------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class CementitiousMaterial:
     relative_density: float
     doe_data_model: DOEDataModel = field(init=False, repr=False)
 
+    # Data model path of the absolute volume (class attribute, not a field); Cement overrides it
+    _abs_volume_path = 'cementitious_material.scm.scm_abs_volume_temp'
+
     def absolute_volume(self, content, water_density, relative_density, cementitious_type=None):
         """
         Calculate the absolute volume of a cementitious material in cubic meters (m³).
@@ -31,7 +171,7 @@ class CementitiousMaterial:
         :param float water_density: Water density (kg/m³ or kgf/m³).
         :param float relative_density: Relative density of cementitious material.
         :param str cementitious_type: Type of cementitious material (e.g., 'Cemento', 'Cenizas volantes',
-                                      'Cemento de escoria', 'Humo de sílice').
+                                      'Cemento de escoria', 'Humo de sílice'), used in the error message.
         :return: The absolute volume (in m³).
         :rtype: float
         """
@@ -44,10 +184,7 @@ class CementitiousMaterial:
 
         # This value could change if there is a minimum cementitious content activated when using an SCM
         abs_volume = content / (relative_density * water_density)
-        if cementitious_type != "Cemento":
-            self.doe_data_model.update_data('cementitious_material.scm.scm_abs_volume_temp', abs_volume * 1000)
-        else:
-            self.doe_data_model.update_data('cementitious_material.cement.cement_abs_volume_temp', abs_volume * 1000)
+        self.doe_data_model.update_data(self._abs_volume_path, abs_volume * 1000)
 
         return abs_volume
 
@@ -64,8 +201,8 @@ class CementitiousMaterial:
 
         :param float water_content: The water content in kg/m³ for the concrete mix.
         :param float w_cm: The water-to-cementitious materials ratio.
-        :param list[str] exposure_classes: A list containing all possible exposure classes, in no particular order,
-                                           (e.g., ['XC1', 'XS2', 'XF4', 'XA1']).
+        :param Sequence[str] exposure_classes: All possible exposure classes, in no particular order,
+                                               (e.g., ['XC1', 'XS2', 'XF4', 'XA1']).
         :param bool scm_checked: True if a supplementary cementitious material is used, otherwise False.
         :param int scm_percentage: Percentage of total cementitious material that is SCM.
         :param bool wra_checked: True if a water-reducing admixture is used, otherwise False.
@@ -80,9 +217,8 @@ class CementitiousMaterial:
             water_content = water_content + (-water_correction_wra)
             self.doe_data_model.update_data('water.water_content.without_wra_correction', water_content)
 
-        # Determine minimum required cementitious content based on exposure classes
-        min_cementitious_content = max(
-            MIN_CEMENTITIOUS_CONTENT_DOE.get(exposure_class, 0) for exposure_class in exposure_classes)
+        # Determine minimum required cementitious content based on exposure classes (cached per set of classes)
+        min_cementitious_content = _min_cementitious_content(tuple(exposure_classes))
 
         # Initialize variables
         initial_cementitious_content = 0
@@ -104,9 +240,13 @@ class CementitiousMaterial:
 
         # Calculate cement and SCM content
         elif scm_checked and scm_percentage is not None:
+            # Percentage of cement, and the effective percentage (an SCM counts as 0.70 of cement), computed once
+            cement_percentage = 100 - scm_percentage
+            effective_percentage = 100 - 0.70 * scm_percentage
+
             # First calculate cement and SCM content based on initial w/cm
-            cement_content = ((100 - scm_percentage) * water_content) / ((100 - 0.70 * scm_percentage) * w_cm)
-            scm_content = (scm_percentage * cement_content) / (100 - scm_percentage)
+            cement_content = (cement_percentage * water_content) / (effective_percentage * w_cm)
+            scm_content = (scm_percentage * cement_content) / cement_percentage
 
             # Calculate the initial cementitious content from the sum of the cement and SCM contents
             initial_cementitious_content = cement_content + scm_content
@@ -118,30 +258,34 @@ class CementitiousMaterial:
                 # Recalculate the w/cm ratio
                 w_cm = water_content / final_cementitious_content
 
-                cement_content = ((100 - scm_percentage) * water_content) / ((100 - 0.70 * scm_percentage) * w_cm)
-                scm_content = (scm_percentage * cement_content) / (100 - scm_percentage)
+                cement_content = (cement_percentage * water_content) / (effective_percentage * w_cm)
+                scm_content = (scm_percentage * cement_content) / cement_percentage
 
         # Store intermediate values in the data model
-        self.doe_data_model.update_data('cementitious_material.base_content', initial_cementitious_content)
-        self.doe_data_model.update_data('cementitious_material.min_content', min_cementitious_content)
-        self.doe_data_model.update_data('cementitious_material.final_content', final_cementitious_content)
-        # This value could change if there is a minimum cementitious content activated when using an SCM
-        self.doe_data_model.update_data('cementitious_material.cement.cement_content_temp', cement_content)
-        self.doe_data_model.update_data('cementitious_material.scm.scm_content_temp', scm_content)
+        self.doe_data_model.update_many({
+            'cementitious_material.base_content': initial_cementitious_content,
+            'cementitious_material.min_content': min_cementitious_content,
+            'cementitious_material.final_content': final_cementitious_content,
+            # This value could change if there is a minimum cementitious content activated when using an SCM
+            'cementitious_material.cement.cement_content_temp': cement_content,
+            'cementitious_material.scm.scm_content_temp': scm_content
+        })
 
         return cement_content, scm_content
 
-@dataclass
+@dataclass(slots=True)
 class Cement(CementitiousMaterial):
     cement_class: str
 
-@dataclass
+    _abs_volume_path = 'cementitious_material.cement.cement_abs_volume_temp'
+
+@dataclass(slots=True)
 class SCM(CementitiousMaterial):
     scm_checked: bool
     scm_type: str
     scm_percentage: int
 
-@dataclass
+@dataclass(slots=True)
 class Water:
     density: float
     doe_data_model: DOEDataModel = field(init=False, repr=False)
@@ -195,20 +339,18 @@ class Water:
         :rtype: float
         """
 
-        # Slump ranges
-        slump_ranges = ["0 mm - 10 mm", "10 mm - 30 mm", "30 mm - 60 mm", "60 mm - 180 mm"]
-        index = slump_ranges.index(slump_range)
+        index = _SLUMP_INDEX[slump_range]
 
         # Reduce the slump range if the mix is air-entrained
         if entrained_air and index != 0:
             index -= 1
 
         # Select the slump range
-        slump_range = slump_ranges[index]
+        slump_range = _SLUMP_RANGES[index]
 
         # Get the base water content
-        water_content_for_coarse = WATER_CONTENT.get(nms, {}).get(agg_types[0], {}).get(slump_range)
-        water_content_for_fine = WATER_CONTENT.get(nms, {}).get(agg_types[1], {}).get(slump_range)
+        water_content_for_coarse = _WATER_CONTENT.get((nms, agg_types[0], slump_range))
+        water_content_for_fine = _WATER_CONTENT.get((nms, agg_types[1], slump_range))
 
         if water_content_for_coarse is None or water_content_for_fine is None:
             valid_nms = list(WATER_CONTENT.keys())
@@ -228,36 +370,26 @@ class Water:
 
         # Apply SCM corrections if applicable
         if scm_checked:
-            # Determine the SCM percentage range
-            if 10 <= scm_percentage < 20:
-                scm_percentage_range = '10-20'
-            elif 20 <= scm_percentage < 30:
-                scm_percentage_range = '20-30'
-            elif 30 <= scm_percentage < 40:
-                scm_percentage_range = '30-40'
-            elif 40 <= scm_percentage < 50:
-                scm_percentage_range = '40-50'
-            elif scm_percentage >= 50:
-                scm_percentage_range = '50'
+            if scm_percentage >= 10:
+                # The SCM percentage range is given by its tens digit (50 % or more share the last range)
+                scm_percentage_range = _SCM_PERCENTAGE_RANGES[int(min(scm_percentage // 10, 5)) - 1]
+                water_correction_scm = - _WATER_CONTENT_REDUCTION.get((scm_percentage_range, slump_range), 0)
             else:  # Handle case for scm_percentage < 10
-                scm_percentage_range = None
                 error_msg = f"SCM percentage ({scm_percentage}%) is less than 10%. No water correction applied"
                 self.doe_data_model.add_calculation_error('Water content', error_msg)
 
-            # Get water correction value if a valid percentage range is determined
-            if scm_percentage_range:
-                water_correction_scm = - WATER_CONTENT_REDUCTION.get(scm_percentage_range, {}).get(slump_range, 0)
-
         # Apply WRA corrections if applicable
         if wra_checked and (wra_action_cement_economizer or wra_action_water_reducer):
             water_correction_wra = -(effectiveness / 100) * water_content
 
         # Store intermediate values in data model
-        self.doe_data_model.update_data('water.water_content.base_agg_fine', water_content_for_fine)
-        self.doe_data_model.update_data('water.water_content.base_agg_coarse', water_content_for_coarse)
-        self.doe_data_model.update_data('water.water_content.base', water_content)
-        self.doe_data_model.update_data('water.water_content.scm_correction', water_correction_scm)
-        self.doe_data_model.update_data('water.water_content.wra_correction', water_correction_wra)
+        self.doe_data_model.update_many({
+            'water.water_content.base_agg_fine': water_content_for_fine,
+            'water.water_content.base_agg_coarse': water_content_for_coarse,
+            'water.water_content.base': water_content,
+            'water.water_content.scm_correction': water_correction_scm,
+            'water.water_content.wra_correction': water_correction_wra
+        })
 
         # Apply corrections to base water content
         final_water_content = water_content + water_correction_scm + water_correction_wra
@@ -284,7 +416,7 @@ class Water:
 
         return water_content + (fine_content_ssd - fine_content_wet) + (coarse_content_ssd - coarse_content_wet)
 
-@dataclass
+@dataclass(slots=True)
 class Air:
     entrained_air: bool
     user_defined: float
@@ -310,35 +442,16 @@ class Air:
         Concrete subject to freezing-and-thawing Exposure Classes XF2, XF3, or XF4 shall be air entrained.
         This method determines the appropriate air content based on exposure classes.
 
-        :param list[str] exposure_classes: A list containing all possible exposure classes, in no particular order,
-                                           (e.g., ['N/A', 'XD1', 'XF3', 'XA3']).
+        :param Sequence[str] exposure_classes: All possible exposure classes, in no particular order,
+                                               (e.g., ['N/A', 'XD1', 'XF3', 'XA3']).
         :return: The entrained air volume in m³ (e.g., 0.05 for 5% air), or 0 if no air entrainment is required.
         :rtype: float
         """
 
-        # Initialize the maximum value
-        max_value = 0
-
-        # Check if any of the provided exposure classes require air entrainment
-        for exposure_class in exposure_classes:
-            # Get the air content table for the exposure class
-            air_content_table = ENTRAINED_AIR.get("DoE", {}).get(exposure_class)
-
-            # Skip if this exposure class isn't defined in our tables
-            if air_content_table is None:
-                continue
-
-            # Update max_value if current air_content_table is greater
-            if air_content_table > max_value:
-                max_value = air_content_table
+        # The reduction over the exposure classes is cached, since sweeps repeat the same classes
+        return _entrained_air_fraction(tuple(exposure_classes))
 
-        # Convert percentage to fraction
-        entrained_air_fraction = max_value / 100
-
-        # Return the calculated fraction
-        return entrained_air_fraction
-
-@dataclass
+@dataclass(slots=True)
 class Aggregate:
     agg_type: str
     relative_density: float
@@ -366,51 +479,47 @@ class Aggregate:
         :rtype: float
         """
 
-        line = DENSITY_COEFFICIENTS.get(combined_relative_density)
-
-        if line is None:
-            # If the value is not in the dictionary, we look for the two closest values
-            keys = list(DENSITY_COEFFICIENTS.keys())
-
-            # Find the closest values for interpolation
-            if combined_relative_density < keys[0]:
-                # If the value is less than the minimum, we use the first coefficient
-                line = DENSITY_COEFFICIENTS[keys[0]]
-                concrete_density = line[1] * water_content + line[0]
-            elif combined_relative_density > keys[-1]:
-                # If the value is greater than the maximum, we use the last coefficient
-                line = DENSITY_COEFFICIENTS[keys[-1]]
-                concrete_density = line[1] * water_content + line[0]
-            else:
-                # Interpolation between two closest values
-                lower_key = max(key for key in keys if key < combined_relative_density)
-                upper_key = min(key for key in keys if key > combined_relative_density)
+        # Position of the relative density among the density lines (binary search over the sorted keys)
+        index = bisect_right(_DENSITY_KEYS, combined_relative_density)
+
+        if index == 0:
+            # If the value is less than the minimum, we use the first coefficient
+            line = DENSITY_COEFFICIENTS[_DENSITY_KEYS[0]]
+            concrete_density = line[1] * water_content + line[0]
+        elif index == len(_DENSITY_KEYS):
+            # If the value is the maximum or greater, we use the last coefficient
+            line = DENSITY_COEFFICIENTS[_DENSITY_KEYS[-1]]
+            concrete_density = line[1] * water_content + line[0]
+        else:
+            # Interpolation between the two closest values (an exact key gives the lower line itself)
+            lower_key = _DENSITY_KEYS[index - 1]
+            upper_key = _DENSITY_KEYS[index]
 
-                # Calculate densities using both coefficients
-                lower_line = DENSITY_COEFFICIENTS[lower_key]
-                upper_line = DENSITY_COEFFICIENTS[upper_key]
+            # Calculate densities using both coefficients
+            lower_line = DENSITY_COEFFICIENTS[lower_key]
+            upper_line = DENSITY_COEFFICIENTS[upper_key]
 
-                lower_density = lower_line[1] * water_content + lower_line[0]
-                upper_density = upper_line[1] * water_content + upper_line[0]
+            lower_density = lower_line[1] * water_content + lower_line[0]
+            upper_density = upper_line[1] * water_content + upper_line[0]
 
-                # Linear interpolation
-                slope = (upper_density - lower_density) / (upper_key - lower_key)
-                concrete_density = lower_density + slope * (combined_relative_density - lower_key)
-        else:
-            # If the value is in the dictionary, we directly use the coefficients
-            concrete_density = line[1] * water_content + line[0]
+            # Linear interpolation
+            slope = (upper_density - lower_density) / (upper_key - lower_key)
+            concrete_density = lower_density + slope * (combined_relative_density - lower_key)
 
         # If the mixture is air-entrained, modify the calculated density
         if entrained_air_content:
-            concrete_density = concrete_density - 10 * (entrained_air_content * 100) * combined_relative_density
+            # 10 kg/m³ per percent of air (the content is a fraction), times the relative density
+            concrete_density = concrete_density - 1000 * entrained_air_content * combined_relative_density
 
         # Calculate the total aggregate content
         total_aggregate_content = concrete_density - (cement_content + scm_content) - water_content
 
         # Store intermediate values in the data model
-        self.doe_data_model.update_data('concrete.combined_relative_density', combined_relative_density)
-        self.doe_data_model.update_data('concrete.wet_density', concrete_density)
-        self.doe_data_model.update_data('concrete.total_aggregate_content', total_aggregate_content)
+        self.doe_data_model.update_many({
+            'concrete.combined_relative_density': combined_relative_density,
+            'concrete.wet_density': concrete_density,
+            'concrete.total_aggregate_content': total_aggregate_content
+        })
 
         return total_aggregate_content
 
@@ -487,7 +596,7 @@ class Aggregate:
 
         return ssd_content * ((100 + moisture_content) / denominator)
 
-@dataclass
+@dataclass(slots=True)
 class FineAggregate(Aggregate):
     fineness_modulus: float
 
@@ -511,41 +620,35 @@ class FineAggregate(Aggregate):
             self.doe_data_model.add_calculation_error('Fine Content', error_msg)
             raise KeyError(error_msg)
 
-        # Find the coefficients for the given percentage passing 600 µm sieve
-        fine_proportion_coeff = FINE_PROPORTION.get(nms, {}).get(slump_range, {}).get(passing_600)
-
-        # If the exact value is not in the dictionary, interpolate
-        if fine_proportion_coeff is None:
-            # Standard percentage values for interpolation
-            keys = [100, 80, 60, 40, 15] # Percentage passing 600 µm sieve
-
-            # Find the closest values for interpolation
-            if passing_600 > keys[0]:
-                # If the value is greater than the maximum, use the maximum percentage
-                fine_proportion_coeff = FINE_PROPORTION.get(nms, {}).get(slump_range, {}).get(keys[0])
-                fine_proportion = fine_proportion_coeff[1] * w_cm + fine_proportion_coeff[0]
-            elif passing_600 < keys[-1]:
-                # If the value is less than the minimum, use the minimum percentage
-                fine_proportion_coeff = FINE_PROPORTION.get(nms, {}).get(slump_range, {}).get(keys[-1])
-                fine_proportion = fine_proportion_coeff[1] * w_cm + fine_proportion_coeff[0]
-            else:
-                # Interpolation between two closest values
-                lower_percentage = max(key for key in keys if key < passing_600)
-                upper_percentage = min(key for key in keys if key > passing_600)
-
-                # Calculate proportion using both lines
-                lower_fine_proportion_coeff = FINE_PROPORTION.get(nms, {}).get(slump_range, {}).get(lower_percentage)
-                lower_fine_proportion = lower_fine_proportion_coeff[1] * w_cm + lower_fine_proportion_coeff[0]
+        # Lines of the given NMS and slump range, resolved once
+        lines = FINE_PROPORTION.get(nms, {}).get(slump_range, {})
 
-                upper_fine_proportion_coeff = FINE_PROPORTION.get(nms, {}).get(slump_range, {}).get(upper_percentage)
-                upper_fine_proportion = upper_fine_proportion_coeff[1] * w_cm + upper_fine_proportion_coeff[0]
+        # Position of the percentage among the fine proportion lines (binary search over the sorted percentages)
+        index = bisect_right(_PASSING_600_KEYS, passing_600)
 
-                # Linear interpolation
-                slope = (upper_fine_proportion - lower_fine_proportion) / (upper_percentage - lower_percentage)
-                fine_proportion = lower_fine_proportion + slope * (passing_600 - lower_percentage)
-        else:
-            # Calculate the fine proportion using the polynomial coefficients
+        if index == 0:
+            # If the value is less than the minimum, use the minimum percentage
+            fine_proportion_coeff = lines.get(_PASSING_600_KEYS[0])
             fine_proportion = fine_proportion_coeff[1] * w_cm + fine_proportion_coeff[0]
+        elif index == len(_PASSING_600_KEYS):
+            # If the value is the maximum or greater, use the maximum percentage
+            fine_proportion_coeff = lines.get(_PASSING_600_KEYS[-1])
+            fine_proportion = fine_proportion_coeff[1] * w_cm + fine_proportion_coeff[0]
+        else:
+            # Interpolation between the two closest values (an exact percentage gives the lower line itself)
+            lower_percentage = _PASSING_600_KEYS[index - 1]
+            upper_percentage = _PASSING_600_KEYS[index]
+
+            # Calculate proportion using both lines
+            lower_fine_proportion_coeff = lines.get(lower_percentage)
+            lower_fine_proportion = lower_fine_proportion_coeff[1] * w_cm + lower_fine_proportion_coeff[0]
+
+            upper_fine_proportion_coeff = lines.get(upper_percentage)
+            upper_fine_proportion = upper_fine_proportion_coeff[1] * w_cm + upper_fine_proportion_coeff[0]
+
+            # Linear interpolation
+            slope = (upper_fine_proportion - lower_fine_proportion) / (upper_percentage - lower_percentage)
+            fine_proportion = lower_fine_proportion + slope * (passing_600 - lower_percentage)
 
         # Store intermediate values in the data model
         self.doe_data_model.update_data('fine_aggregate.fine_proportion', fine_proportion)
@@ -555,7 +658,7 @@ class FineAggregate(Aggregate):
 
         return fine_content_ssd
 
-@dataclass
+@dataclass(slots=True)
 class CoarseAggregate(Aggregate):
     nominal_max_size: str
 
@@ -574,17 +677,17 @@ class CoarseAggregate(Aggregate):
 
         return coarse_content_ssd
 
-@dataclass
+@dataclass(slots=True)
 class FreshConcrete:
     slump_range: str
 
-@dataclass
+@dataclass(slots=True)
 class HardenedConcrete:
     design_strength: int
     spec_strength_time: str
     exposure_classes: dict
 
-@dataclass
+@dataclass(slots=True)
 class StandardDeviation:
     std_dev_known: bool
     std_dev_value: float
@@ -613,8 +716,6 @@ class StandardDeviation:
 
         # Initialize the variable
         f_cr = 0
-        std_dev_value_1 = 0
-        std_dev_value_2 = 0
 
         # Case 1: The margin is specified by the user (the standard deviation is unknown)
         if user_defined_margin >= 0 and std_dev_unknown:
@@ -624,35 +725,23 @@ class StandardDeviation:
         elif std_dev_known:
             z = QUARTILES.get(defective_level)  # Get z value (quartile) based on defective level
 
-            if sample_size < 20:  # Curve A
-                if design_strength <= 20:
-                    std_dev_value_1 = std_dev_value
-                    std_dev_value_2 = 0.4 * design_strength
-                    std_dev_value = max(std_dev_value_1, std_dev_value_2)
-                    f_cr = design_strength - z * std_dev_value
-                else:
-                    std_dev_value_1 = std_dev_value
-                    std_dev_value_2 = 8
-                    std_dev_value = max(std_dev_value_1, std_dev_value_2)
-                    f_cr = design_strength - z * std_dev_value
-            elif sample_size >= 20:  # Curve B
-                if design_strength <= 20:
-                    std_dev_value_1 = std_dev_value
-                    std_dev_value_2 = 0.2 * design_strength
-                    std_dev_value = max(std_dev_value_1, std_dev_value_2)
-                    f_cr = design_strength - z * std_dev_value
-                else:
-                    std_dev_value_1 = std_dev_value
-                    std_dev_value_2 = 4
-                    std_dev_value = max(std_dev_value_1, std_dev_value_2)
-                    f_cr = design_strength - z * std_dev_value
+            # Minimum standard deviation from Curve A (fewer than 20 samples) or Curve B
+            low_strength = design_strength <= 20
+            min_std_dev = _MIN_STD_DEV[(sample_size < 20, low_strength)]
+
+            std_dev_value_1 = std_dev_value
+            std_dev_value_2 = min_std_dev * design_strength if low_strength else min_std_dev
+            std_dev_value = max(std_dev_value_1, std_dev_value_2)
+            f_cr = design_strength - z * std_dev_value
 
             # Update the DoE data model with intermediate values
-            self.doe_data_model.update_data('spec_strength.target_strength.z_value', z)
-            self.doe_data_model.update_data('spec_strength.target_strength.std_dev_value_1', std_dev_value_1)
-            self.doe_data_model.update_data('spec_strength.target_strength.std_dev_value_2', std_dev_value_2)
-            self.doe_data_model.update_data('spec_strength.target_strength.std_dev_used', std_dev_value)
-            self.doe_data_model.update_data('spec_strength.target_strength.margin', user_defined_margin)
+            self.doe_data_model.update_many({
+                'spec_strength.target_strength.z_value': z,
+                'spec_strength.target_strength.std_dev_value_1': std_dev_value_1,
+                'spec_strength.target_strength.std_dev_value_2': std_dev_value_2,
+                'spec_strength.target_strength.std_dev_used': std_dev_value,
+                'spec_strength.target_strength.margin': user_defined_margin
+            })
 
         else:
             # If no condition is met, raises a value error exception
@@ -662,11 +751,12 @@ class StandardDeviation:
 
         # Target strength for air-entrained concrete
         if entrained_air_content:
-            f_cr = f_cr / (1 - 0.055 * (entrained_air_content * 100))
+            # 5.5 % of strength lost per percent of air (the content is a fraction)
+            f_cr = f_cr / (1 - 5.5 * entrained_air_content)
 
         return f_cr
 
-@dataclass
+@dataclass(slots=True)
 class AbramsLaw:
     doe_data_model: DOEDataModel = field(init=False, repr=False)
 
@@ -689,16 +779,13 @@ class AbramsLaw:
         :param float target_strength: The target compressive strength of concrete in MPa.
         :param str target_strength_time: The expected time to reach the target strength,
                                          also known as the age of the test (e.g., "7 días", "27 días", "90 días").
-        :param list[str] exposure_classes: A list containing all possible exposure classes, in no particular order,
-                                           (e.g., ['XC1', 'XS2', 'XF4', 'XA1']).
+        :param Sequence[str] exposure_classes: All possible exposure classes, in no particular order,
+                                               (e.g., ['XC1', 'XS2', 'XF4', 'XA1']).
         :param bool scm_checked: True if an SCM is used, otherwise False.
         :return: The recommended water-to-cementitious materials ratio.
         :rtype: float
         """
 
-        # Initialize the variable
-        index = 0
-
         # Calculate w/cm ratio based on target strength
         # Selected the starting point (w/cm -> 0.50; f_0)
         f_0_for_coarse = STARTING_STRENGTH.get(cement_class, {}).get(agg_types[0], {}).get(target_strength_time)
@@ -707,63 +794,56 @@ class AbramsLaw:
         # Get the average value if the coarse and fine aggregate type are different
         f_0 = (f_0_for_coarse + f_0_for_fine) / 2 # If they are the same this does not change its value
 
-        # Create the list with all the third degree polynomials that represent the fitted curves
-        polynomials = [Polynomial(coefficients) for coefficients in W_CM_COEFFICIENTS.values()] # From the lowest curve to the highest
-
-        # 1. Find between which curves the starting point f_0 is located
-        vals = [p(0.5) for p in polynomials]
-        for i in range(len(vals) - 1):
-            if vals[i] <= f_0 <= vals[i+1]:
-                index = i
-                break
+        # 1. Find between which curves the starting point f_0 is located (binary search over the ascending values;
+        # a value equal to a curve takes the pair below it). Outside the curves, the first pair is used
+        vals = _W_CM_CURVES_AT_HALF
+        index = bisect_left(vals, f_0) - 1
+        if not 0 <= index < len(vals) - 1:
+            index = 0
 
         # 2. Find the fraction "alpha"
-        alpha = (f_0 - vals[index]) / (vals[index + 1] - vals[index])
+        alpha = (f_0 - vals[index]) / _W_CM_STEPS_AT_HALF[index]
 
-        # 3. Create the interpolated polynomial
-        p_i = polynomials[index]
-        p_i1 = polynomials[index + 1]
-
-        p_diff = Polynomial(np.subtract(p_i1.coef, p_i.coef))
-        p_star_coef = np.add(p_i.coef, alpha * p_diff.coef)
-        p_star = Polynomial(p_star_coef)
+        # 3. Create the interpolated polynomial (as its coefficients, in ascending order)
+        p_star_coef = tuple(c + alpha * step
+                            for c, step in zip(_W_CM_COEFFICIENTS[index], _W_CM_COEFFICIENT_STEPS[index]))
 
         # 4. Solve for the target strength value
-        p_equation = Polynomial(np.copy(p_star_coef))
-        p_equation.coef[0] -= target_strength  # subtract target_strength from the independent term
+        p_equation_coef = (p_star_coef[0] - target_strength, *p_star_coef[1:]) # subtract it from the independent term
 
-        roots = p_equation.roots() # it returns the roots (possibly complex)
+        x_candidates = _cubic_real_roots(p_equation_coef) # the real roots, in ascending order
 
         # 5. Choose the real root in the range [0.3, 0.9]
-        x_candidates = [r.real for r in roots if abs(r.imag) < 1e-7]
-        x_valid = [r for r in x_candidates if 0.3 <= r <= 0.9]
-
-        if len(x_valid) == 0:
+        # It could be more than one, but usually only one (the lowest is taken, so the scan stops at the first)
+        for root in x_candidates:
+            if 0.3 <= root <= 0.9:
+                w_cm_by_strength = root
+                break
+        else:
             error_msg = "No solution found in the expected range"
             self.doe_data_model.add_calculation_error('Water-cement ratio', error_msg)
             raise KeyError(error_msg)
-        else:
-            # It could be more than one, but usually only one
-            w_cm_by_strength = x_valid[0]
 
         # Calculate w/cm ratio based on durability requirements
         # The most restrictive (lowest) w/cm from all exposure classes is selected
         if not scm_checked:
-            w_cm_by_durability = [MAX_W_CM_DOE.get(exposure_class, 1.0) for exposure_class in exposure_classes]
-            w_cm_by_durability = min(w_cm_by_durability)
+            w_cm_by_durability = _max_w_cm_by_durability(tuple(exposure_classes))
         else: # If an SCM is used, do not compare the w/cm calculated above with the limits, as this will be done later
             w_cm_by_durability = 1
 
         # Store intermediate calculation results in the DoE data model for reference
-        self.doe_data_model.update_data('water_cementitious_materials_ratio.w_cm_curve', p_star)
-        self.doe_data_model.update_data('water_cementitious_materials_ratio.w_cm_by_strength', w_cm_by_strength)
-        self.doe_data_model.update_data('water_cementitious_materials_ratio.w_cm_by_durability', w_cm_by_durability)
-        self.doe_data_model.update_data('water_cementitious_materials_ratio.w_cm_previous', min(w_cm_by_strength, w_cm_by_durability))
+        self.doe_data_model.update_many({
+            # Only the coefficients are stored, the data model builds the Polynomial when it is read
+            'water_cementitious_materials_ratio.w_cm_curve_coef': p_star_coef,
+            'water_cementitious_materials_ratio.w_cm_by_strength': w_cm_by_strength,
+            'water_cementitious_materials_ratio.w_cm_by_durability': w_cm_by_durability,
+            'water_cementitious_materials_ratio.w_cm_previous': min(w_cm_by_strength, w_cm_by_durability)
+        })
 
         # Return the more restrictive (lower) w/cm ratio to satisfy both strength and durability
         return min(w_cm_by_strength, w_cm_by_durability)
 
-@dataclass
+@dataclass(slots=True)
 class Admixture:
     doe_data_model: DOEDataModel = field(init=False, repr=False)
 
@@ -801,7 +881,7 @@ class Admixture:
             raise ZeroDivisionError(error_msg)
         return content / (relative_density * water_density)
 
-@dataclass
+@dataclass(slots=True)
 class WRA(Admixture):
     wra_checked: bool
     wra_action_plasticizer: bool
@@ -811,13 +891,95 @@ class WRA(Admixture):
     dosage: float
     effectiveness: float
 
-@dataclass
+@dataclass(slots=True)
 class AEA(Admixture):
     aea_checked: bool
     relative_density: float
     dosage: float
 
 
+# Design values read by DOE.load_inputs
+_INPUT_PATHS = (
+    'field_requirements.strength.spec_strength',
+    'field_requirements.strength.std_dev_known.std_dev_value',
+    'field_requirements.strength.std_dev_unknown.margin',
+    'cementitious_materials.cement_relative_density',
+    'cementitious_materials.cement_class',
+    'cementitious_materials.SCM.SCM_relative_density',
+    'cementitious_materials.SCM.SCM_checked',
+    'cementitious_materials.SCM.SCM_type',
+    'cementitious_materials.SCM.SCM_content',
+    'water.water_density',
+    'field_requirements.entrained_air_content.is_checked',
+    'field_requirements.entrained_air_content.user_defined',
+    'field_requirements.entrained_air_content.exposure_defined',
+    'fine_aggregate.info.type',
+    'fine_aggregate.physical_prop.relative_density_SSD',
+    'fine_aggregate.physical_prop.PUS',
+    'fine_aggregate.physical_prop.PUC',
+    'fine_aggregate.moisture.moisture_content',
+    'fine_aggregate.moisture.absorption_content',
+    'fine_aggregate.gradation.passing',
+    'fine_aggregate.fineness_modulus',
+    'coarse_aggregate.info.type',
+    'coarse_aggregate.physical_prop.relative_density_SSD',
+    'coarse_aggregate.physical_prop.PUS',
+    'coarse_aggregate.physical_prop.PUC',
+    'coarse_aggregate.moisture.moisture_content',
+    'coarse_aggregate.moisture.absorption_content',
+    'coarse_aggregate.gradation.passing',
+    'coarse_aggregate.NMS',
+    'field_requirements.slump_range',
+    'field_requirements.strength.spec_strength_time',
+    'validation.exposure_classes',
+    'field_requirements.strength.std_dev_known.std_dev_known_enabled',
+    'field_requirements.strength.std_dev_known.test_nro',
+    'field_requirements.strength.std_dev_known.defective_level',
+    'field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled',
+    'chemical_admixtures.WRA.WRA_checked',
+    'chemical_admixtures.WRA.WRA_action.plasticizer',
+    'chemical_admixtures.WRA.WRA_action.water_reducer',
+    'chemical_admixtures.WRA.WRA_action.cement_economizer',
+    'chemical_admixtures.WRA.WRA_relative_density',
+    'chemical_admixtures.WRA.WRA_dosage',
+    'chemical_admixtures.WRA.WRA_effectiveness',
+    'chemical_admixtures.AEA.AEA_checked',
+    'chemical_admixtures.AEA.AEA_relative_density',
+    'chemical_admixtures.AEA.AEA_dosage',
+)
+
+# Key path in the DoE data model of each calculation result (the same keys as DOE.calculation_results)
+_RESULT_PATHS = {
+    "target_strength_value": "spec_strength.target_strength.target_strength_value",
+    "w_cm": "water_cementitious_materials_ratio.w_cm",
+    "entrapped_air_content": "air.entrapped_air_content",
+    "entrained_air_content": "air.entrained_air_content",
+    "final_content": "water.water_content.final_content",
+    "water_content_correction": "water.water_content_correction",
+    "water_abs_volume": "water.water_abs_volume",
+    "water_volume": "water.water_volume",
+    "cement_content": "cementitious_material.cement.cement_content",
+    "cement_abs_volume": "cementitious_material.cement.cement_abs_volume",
+    "cement_volume": "cementitious_material.cement.cement_volume",
+    "scm_content": "cementitious_material.scm.scm_content",
+    "scm_abs_volume": "cementitious_material.scm.scm_abs_volume",
+    "scm_volume": "cementitious_material.scm.scm_volume",
+    "fine_content_ssd": "fine_aggregate.fine_content_ssd",
+    "fine_content_wet": "fine_aggregate.fine_content_wet",
+    "fine_abs_volume": "fine_aggregate.fine_abs_volume",
+    "fine_volume": "fine_aggregate.fine_volume",
+    "coarse_content_ssd": "coarse_aggregate.coarse_content_ssd",
+    "coarse_content_wet": "coarse_aggregate.coarse_content_wet",
+    "coarse_abs_volume": "coarse_aggregate.coarse_abs_volume",
+    "coarse_volume": "coarse_aggregate.coarse_volume",
+    "WRA_content": "chemical_admixtures.WRA.WRA_content",
+    "WRA_volume": "chemical_admixtures.WRA.WRA_volume",
+    "AEA_content": "chemical_admixtures.AEA.AEA_content",
+    "AEA_volume": "chemical_admixtures.AEA.AEA_volume",
+    "total_abs_volume": "summation.total_abs_volume",
+    "total_content": "summation.total_content",
+}
+
 # ------------------------------------------------ Main class ------------------------------------------------
 class DOE:
     def __init__(self, data_model, doe_data_model):
@@ -845,6 +1007,12 @@ class DOE:
         self.wra = None
         self.aea = None
 
+        # Conversion factors of the current unit system by unit type (refreshed in load_inputs, before converting)
+        self._unit_factors = CONVERSION_FACTORS.get(self.data_model.units, {})
+
+        # Design values (with the unit system and the DoE data model) the components were last built from
+        self._loaded_inputs = None
+
         # Dictionary to store the calculated results for later use in the report
         self.calculation_results = {}
 
@@ -863,15 +1031,12 @@ class DOE:
         if value is None:
             return None
 
-        # Get the current unit system from the data model, e.g. "MKS" or "SI"
-        current_units = self.data_model.units
-
         # Look up the conversion factor for the current unit system and the target unit
-        factor = CONVERSION_FACTORS.get(current_units, {}).get(unit)
+        factor = self._unit_factors.get(unit)
         if factor is None:
             # Log a warning if no factor is found
             self.logger.warning(
-                f"No conversion factor found for unit system '{current_units}' and target unit '{unit}'")
+                f"No conversion factor found for unit system '{self.data_model.units}' and target unit '{unit}'")
             return None
 
         # Return the converted value by multiplying with the factor.
@@ -881,13 +1046,29 @@ class DOE:
         """
         Load data from the data model and perform unit conversion for selected parameters,
         and instantiates the necessary objects.
+
+        If the design values (and the unit system) have not changed since the last call, the material components
+        of that call are kept, since they would be rebuilt identically.
         """
 
         try:
-            # Convert units if necessary
-            design_strength = self.data_model.get_design_value('field_requirements.strength.spec_strength')
-            std_dev_value = self.data_model.get_design_value('field_requirements.strength.std_dev_known.std_dev_value')
-            user_defined_margin = self.data_model.get_design_value('field_requirements.strength.std_dev_unknown.margin')
+            # Fetch all the design values needed at once
+            values = self.data_model.get_design_values(_INPUT_PATHS)
+
+            # Reuse the components of the previous call if nothing they are built from has changed. The dict values
+            # (gradings and exposure classes) are references into the data model, so their items are snapshotted
+            inputs_key = (self.data_model.units, self.doe_data_model,
+                          tuple(tuple(value.items()) if isinstance(value, dict) else value
+                                for value in values.values()))
+            if inputs_key == self._loaded_inputs:
+                self.logger.debug("Input data unchanged, the material components are reused")
+                return
+
+            # Convert units if necessary (with the conversion factors of the current unit system)
+            self._unit_factors = CONVERSION_FACTORS.get(self.data_model.units, {})
+            design_strength = values['field_requirements.strength.spec_strength']
+            std_dev_value = values['field_requirements.strength.std_dev_known.std_dev_value']
+            user_defined_margin = values['field_requirements.strength.std_dev_unknown.margin']
             if self.data_model.units == "MKS":
                 design_strength = self.convert_value(design_strength, "stress")
                 std_dev_value = self.convert_value(std_dev_value, "stress")
@@ -895,75 +1076,69 @@ class DOE:
 
             # Instantiate the components with their corresponding data
             self.cement = Cement(
-                relative_density=self.data_model.get_design_value('cementitious_materials.cement_relative_density'),
-                cement_class=self.data_model.get_design_value("cementitious_materials.cement_class")
+                relative_density=values['cementitious_materials.cement_relative_density'],
+                cement_class=values["cementitious_materials.cement_class"]
             )
             self.scm = SCM(
-                relative_density=self.data_model.get_design_value('cementitious_materials.SCM.SCM_relative_density'),
-                scm_checked=self.data_model.get_design_value('cementitious_materials.SCM.SCM_checked'),
-                scm_type=self.data_model.get_design_value('cementitious_materials.SCM.SCM_type'),
-                scm_percentage=self.data_model.get_design_value('cementitious_materials.SCM.SCM_content')
+                relative_density=values['cementitious_materials.SCM.SCM_relative_density'],
+                scm_checked=values['cementitious_materials.SCM.SCM_checked'],
+                scm_type=values['cementitious_materials.SCM.SCM_type'],
+                scm_percentage=values['cementitious_materials.SCM.SCM_content']
             )
-            self.water = Water(density=self.data_model.get_design_value('water.water_density'))
+            self.water = Water(density=values['water.water_density'])
             self.air = Air(
-                entrained_air=self.data_model.get_design_value('field_requirements.entrained_air_content.is_checked'),
-                user_defined=self.data_model.get_design_value('field_requirements.entrained_air_content.user_defined'),
-                exposure_defined=self.data_model.get_design_value('field_requirements.entrained_air_content.exposure_defined')
+                entrained_air=values['field_requirements.entrained_air_content.is_checked'],
+                user_defined=values['field_requirements.entrained_air_content.user_defined'],
+                exposure_defined=values['field_requirements.entrained_air_content.exposure_defined']
             )
             self.fine_agg = FineAggregate(
-                agg_type=self.data_model.get_design_value("fine_aggregate.info.type"),
-                relative_density=self.data_model.get_design_value("fine_aggregate.physical_prop.relative_density_SSD"),
-                loose_bulk_density=self.data_model.get_design_value("fine_aggregate.physical_prop.PUS"),
-                compacted_bulk_density=self.data_model.get_design_value("fine_aggregate.physical_prop.PUC"),
-                moisture_content=self.data_model.get_design_value("fine_aggregate.moisture.moisture_content"),
-                moisture_absorption=self.data_model.get_design_value("fine_aggregate.moisture.absorption_content"),
-                grading=self.data_model.get_design_value("fine_aggregate.gradation.passing"),
-                fineness_modulus=self.data_model.get_design_value("fine_aggregate.fineness_modulus")
+                agg_type=values["fine_aggregate.info.type"],
+                relative_density=values["fine_aggregate.physical_prop.relative_density_SSD"],
+                loose_bulk_density=values["fine_aggregate.physical_prop.PUS"],
+                compacted_bulk_density=values["fine_aggregate.physical_prop.PUC"],
+                moisture_content=values["fine_aggregate.moisture.moisture_content"],
+                moisture_absorption=values["fine_aggregate.moisture.absorption_content"],
+                grading=values["fine_aggregate.gradation.passing"],
+                fineness_modulus=values["fine_aggregate.fineness_modulus"]
             )
             self.coarse_agg = CoarseAggregate(
-                agg_type=self.data_model.get_design_value("coarse_aggregate.info.type"),
-                relative_density=self.data_model.get_design_value("coarse_aggregate.physical_prop.relative_density_SSD"),
-                loose_bulk_density=self.data_model.get_design_value("coarse_aggregate.physical_prop.PUS"),
-                compacted_bulk_density=self.data_model.get_design_value("coarse_aggregate.physical_prop.PUC"),
-                moisture_content=self.data_model.get_design_value("coarse_aggregate.moisture.moisture_content"),
-                moisture_absorption=self.data_model.get_design_value("coarse_aggregate.moisture.absorption_content"),
-                grading=self.data_model.get_design_value("coarse_aggregate.gradation.passing"),
-                nominal_max_size=self.data_model.get_design_value("coarse_aggregate.NMS")
+                agg_type=values["coarse_aggregate.info.type"],
+                relative_density=values["coarse_aggregate.physical_prop.relative_density_SSD"],
+                loose_bulk_density=values["coarse_aggregate.physical_prop.PUS"],
+                compacted_bulk_density=values["coarse_aggregate.physical_prop.PUC"],
+                moisture_content=values["coarse_aggregate.moisture.moisture_content"],
+                moisture_absorption=values["coarse_aggregate.moisture.absorption_content"],
+                grading=values["coarse_aggregate.gradation.passing"],
+                nominal_max_size=values["coarse_aggregate.NMS"]
             )
-            self.fresh_concrete = FreshConcrete(slump_range=self.data_model.get_design_value("field_requirements.slump_range"))
+            self.fresh_concrete = FreshConcrete(slump_range=values["field_requirements.slump_range"])
             self.hardened_concrete = HardenedConcrete(
                 design_strength=design_strength,
-                spec_strength_time=self.data_model.get_design_value("field_requirements.strength.spec_strength_time"),
-                exposure_classes=self.data_model.get_design_value("validation.exposure_classes")
+                spec_strength_time=values["field_requirements.strength.spec_strength_time"],
+                exposure_classes=values["validation.exposure_classes"]
             )
             self.std_deviation = StandardDeviation(
-                std_dev_known=self.data_model.get_design_value(
-                    "field_requirements.strength.std_dev_known.std_dev_known_enabled"),
+                std_dev_known=values["field_requirements.strength.std_dev_known.std_dev_known_enabled"],
                 std_dev_value=std_dev_value,
-                sample_size=self.data_model.get_design_value("field_requirements.strength.std_dev_known.test_nro"),
-                defective_level=self.data_model.get_design_value(
-                    "field_requirements.strength.std_dev_known.defective_level"),
-                std_dev_unknown=self.data_model.get_design_value(
-                    "field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled"),
+                sample_size=values["field_requirements.strength.std_dev_known.test_nro"],
+                defective_level=values["field_requirements.strength.std_dev_known.defective_level"],
+                std_dev_unknown=values["field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled"],
                 user_defined_margin=user_defined_margin
             )
             self.abrams_law = AbramsLaw()
             self.wra = WRA(
-                wra_checked=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_checked'),
-                wra_action_plasticizer=self.data_model.get_design_value(
-                    'chemical_admixtures.WRA.WRA_action.plasticizer'),
-                wra_action_water_reducer=self.data_model.get_design_value(
-                    'chemical_admixtures.WRA.WRA_action.water_reducer'),
-                wra_action_cement_economizer=self.data_model.get_design_value(
-                    'chemical_admixtures.WRA.WRA_action.cement_economizer'),
-                relative_density=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_relative_density'),
-                dosage=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_dosage'),
-                effectiveness=self.data_model.get_design_value('chemical_admixtures.WRA.WRA_effectiveness')
+                wra_checked=values['chemical_admixtures.WRA.WRA_checked'],
+                wra_action_plasticizer=values['chemical_admixtures.WRA.WRA_action.plasticizer'],
+                wra_action_water_reducer=values['chemical_admixtures.WRA.WRA_action.water_reducer'],
+                wra_action_cement_economizer=values['chemical_admixtures.WRA.WRA_action.cement_economizer'],
+                relative_density=values['chemical_admixtures.WRA.WRA_relative_density'],
+                dosage=values['chemical_admixtures.WRA.WRA_dosage'],
+                effectiveness=values['chemical_admixtures.WRA.WRA_effectiveness']
             )
             self.aea = AEA(
-                aea_checked=self.data_model.get_design_value('chemical_admixtures.AEA.AEA_checked'),
-                relative_density=self.data_model.get_design_value('chemical_admixtures.AEA.AEA_relative_density'),
-                dosage=self.data_model.get_design_value('chemical_admixtures.AEA.AEA_dosage')
+                aea_checked=values['chemical_admixtures.AEA.AEA_checked'],
+                relative_density=values['chemical_admixtures.AEA.AEA_relative_density'],
+                dosage=values['chemical_admixtures.AEA.AEA_dosage']
             )
 
             # Connect to the DoE data model
@@ -976,8 +1151,9 @@ class DOE:
             self.std_deviation.doe_data_model = self.doe_data_model
             self.abrams_law.doe_data_model = self.doe_data_model
             self.wra.doe_data_model = self.doe_data_model
-            self.aea.aci_data_model = self.doe_data_model
+            self.aea.doe_data_model = self.doe_data_model
 
+            self._loaded_inputs = inputs_key
             self.logger.debug("Input data loaded and converted successfully")
         except Exception as e:
             self.logger.error(f"Error loading or converting input data: {str(e)}")
@@ -997,7 +1173,7 @@ class DOE:
         try:
             # A. Air Content
             entrained_air = self.air.entrained_air
-            exposure_classes = list(self.hardened_concrete.exposure_classes.values())
+            exposure_classes = tuple(self.hardened_concrete.exposure_classes.values())
             entrained_air_content = 0
             entrapped_air_content = 0
 
@@ -1067,7 +1243,7 @@ class DOE:
             # F. Review the Water-Cementitious Materials ratio
             if scm_checked:
                 w_cm_recalculated = water_content / (cement_content + scm_content)
-                w_cm_by_durability = min([MAX_W_CM_DOE.get(exposure_class, 1.0) for exposure_class in exposure_classes])
+                w_cm_by_durability = _max_w_cm_by_durability(exposure_classes)
                 self.doe_data_model.update_data('water_cementitious_materials_ratio.w_cm_by_durability',
                                                 w_cm_by_durability)
 
@@ -1236,36 +1412,10 @@ class DOE:
             self.logger.error("No calculation results to update in the data model")
             return
 
-        for key, value in self.calculation_results.items():
-            # The key paths according to DoE data model schema
-            if key == "target_strength_value":
-                data_key = "spec_strength.target_strength.target_strength_value"
-            elif key == "w_cm":
-                data_key = "water_cementitious_materials_ratio.w_cm"
-            elif key in ("entrapped_air_content", "entrained_air_content"):
-                data_key = f"air.{key}"
-            elif key == "final_content":
-                data_key = f"water.water_content.{key}"
-            elif key in ("water_content_correction", "water_abs_volume", "water_volume"):
-                data_key = f"water.{key}"
-            elif key in ("cement_content", "cement_abs_volume", "cement_volume"):
-                data_key = f"cementitious_material.cement.{key}"
-            elif key in ("scm_content", "scm_abs_volume", "scm_volume"):
-                data_key = f"cementitious_material.scm.{key}"
-            elif key in ("fine_content_ssd", "fine_content_wet", "fine_abs_volume", "fine_volume"):
-                data_key = f"fine_aggregate.{key}"
-            elif key in ("coarse_content_ssd", "coarse_content_wet", "coarse_abs_volume", "coarse_volume"):
-                data_key = f"coarse_aggregate.{key}"
-            elif key in ("WRA_content", "WRA_volume"):
-                data_key = f"chemical_admixtures.WRA.{key}"
-            elif key in ("AEA_content", "AEA_volume"):
-                data_key = f"chemical_admixtures.AEA.{key}"
-            elif key in ("total_abs_volume", "total_content"):
-                data_key = f"summation.{key}"
-            else:
-                continue
-
-            self.doe_data_model.update_data(data_key, value)
+        # The key paths according to the DoE data model schema, written in a single batch.
+        # None results are written too, so that values from a previous run are cleared
+        results = self.calculation_results
+        self.doe_data_model.update_many({path: results[key] for key, path in _RESULT_PATHS.items()})
         self.logger.debug("DoE data model updated with calculation results")
 
     def run(self):
@@ -0,0 +1,76 @@
+"""
+Vectorized (NumPy) versions of the DoE volume arithmetic.
+
+The classes in doe.py work on a single mix at a time and raise (after recording the error in the DoE data model) when
+a denominator is zero. For parameter studies, the functions in this module evaluate the same equations on whole arrays
+at once: each sample with a zero denominator gets NaN instead of stopping the batch, and no data model is touched.
+"""
+import numpy as np
+
+LITERS_PER_CUBIC_METER = 1000
+
+
+def _divide(numerator, denominator):
+    """Divide element-wise, with NaN wherever the denominator is zero."""
+
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        quotient = numerator / denominator
+
+    return np.where(denominator != 0, quotient, np.nan)
+
+
+def water_volume(water_content, density):
+    """
+    Calculate the volume of water (in m³) for arrays of mixes.
+
+    :param np.ndarray water_content: The contents of water (kg or kgf).
+    :param np.ndarray | float density: The water densities (kg/m³ or kgf/m³).
+    :return: The absolute volumes of water (in m³), NaN where the density is zero.
+    :rtype: np.ndarray
+    """
+
+    return _divide(water_content, density)
+
+
+def absolute_volume(content, water_density, relative_density):
+    """
+    Calculate the absolute volume (in m³) of a cementitious material or an aggregate for arrays of mixes.
+
+    :param np.ndarray content: The contents of the material (kg or kgf).
+    :param np.ndarray | float water_density: Water densities (kg/m³ or kgf/m³).
+    :param np.ndarray relative_density: The relative densities of the material.
+    :return: The absolute volumes (in m³), NaN where the relative density or the water density is zero.
+    :rtype: np.ndarray
+    """
+
+    return _divide(content, np.multiply(relative_density, water_density, dtype=np.float64))
+
+
+def apparent_volume(content, loose_bulk_density):
+    """
+    Calculate the apparent volume (in liters) of an aggregate for arrays of mixes.
+
+    :param np.ndarray content: The aggregate contents (kg or kgf).
+    :param np.ndarray loose_bulk_density: The loose bulk densities (kg/m³) or loose unit weights (kgf/m³).
+    :return: The apparent volumes (in liters), NaN where the loose bulk density is zero.
+    :rtype: np.ndarray
+    """
+
+    return _divide(content, np.asarray(loose_bulk_density, dtype=np.float64) / LITERS_PER_CUBIC_METER)
+
+
+def content_moisture_correction(ssd_content, moisture_content, absorption):
+    """
+    Adjust arrays of aggregate contents from an SSD (saturated surface-dry) condition to a wet condition.
+
+    :param np.ndarray ssd_content: Aggregate contents under SSD conditions.
+    :param np.ndarray moisture_content: Moisture contents of the aggregates as a percentage.
+    :param np.ndarray absorption: Absorption capacities of the aggregates as a percentage.
+    :return: Adjusted aggregate contents under wet conditions, NaN where the absorption is -100 %.
+    :rtype: np.ndarray
+    """
+
+    return np.asarray(ssd_content, dtype=np.float64) * _divide(100 + np.asarray(moisture_content, dtype=np.float64),
+                                                               100 + np.asarray(absorption, dtype=np.float64))
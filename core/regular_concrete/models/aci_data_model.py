@@ -1,3 +1,6 @@
+import logging
+
+from core.regular_concrete.models.key_path import split_key_path
 from logger import Logger
 
 
@@ -107,18 +110,42 @@ class ACIDataModel:
         :param any value: The new value to update.
         """
 
-        keys = key_path.split('.')
+        parents, last = split_key_path(key_path)
         data = self.aci_data
 
         try:
-            for key in keys[:-1]:
+            for key in parents:
                 data = data[key]
-            data[keys[-1]] = value
+            data[last] = value
             self.logger.info(f"Updated {key_path} -> {value}")
         except KeyError as e:
             self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
             raise
 
+    def update_many(self, updates):
+        """
+        Update several values at once using dot notation to access nested keys.
+
+        :param dict[str, any] updates: The key paths to update mapped to their new values,
+                                       e.g. {'water.water_content.base': 175, ...}.
+        """
+
+        for key_path, value in updates.items():
+            parents, last = split_key_path(key_path)
+            data = self.aci_data
+
+            try:
+                for key in parents:
+                    data = data[key]
+                data[last] = value
+            except KeyError as e:
+                self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
+                raise
+
+        # The message lists the whole batch, so it is only built if INFO records are emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Updated %s", ", ".join(f"{key_path} -> {value}" for key_path, value in updates.items()))
+
     def get_data(self, key_path):
         """
         Get the design value using dot notation (as key).
@@ -128,12 +155,12 @@ class ACIDataModel:
         :rtype: any
         """
 
-        keys = key_path.split('.')
+        parents, last = split_key_path(key_path)
         data = self.aci_data
         try:
-            for key in keys:
+            for key in parents:
                 data = data[key]
-            return data
+            return data[last]
         except KeyError as e:
             self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
             raise
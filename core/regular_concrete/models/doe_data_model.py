@@ -1,3 +1,8 @@
+import logging
+
+from numpy.polynomial import Polynomial
+
+from core.regular_concrete.models.key_path import split_key_path
 from logger import Logger
 
 
@@ -88,7 +93,7 @@ class DOEDataModel:
             'water_cementitious_materials_ratio': {
                 'w_cm': None,
                 'w_cm_previous': None,
-                'w_cm_curve': None,
+                'w_cm_curve_coef': None, # coefficients in ascending order, see the w_cm_curve property
                 'w_cm_by_strength': None,
                 'w_cm_by_durability': None
             },
@@ -116,18 +121,42 @@ class DOEDataModel:
         :param any value: The new value to update.
         """
 
-        keys = key_path.split('.')
+        parents, last = split_key_path(key_path)
         data = self.doe_data
 
         try:
-            for key in keys[:-1]:
+            for key in parents:
                 data = data[key]
-            data[keys[-1]] = value
+            data[last] = value
             self.logger.info(f"Updated {key_path} -> {value}")
         except KeyError as e:
             self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
             raise
 
+    def update_many(self, updates):
+        """
+        Update several values at once using dot notation to access nested keys.
+
+        :param dict[str, any] updates: The key paths to update mapped to their new values,
+                                       e.g. {'water.water_content.base': 175, ...}.
+        """
+
+        for key_path, value in updates.items():
+            parents, last = split_key_path(key_path)
+            data = self.doe_data
+
+            try:
+                for key in parents:
+                    data = data[key]
+                data[last] = value
+            except KeyError as e:
+                self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
+                raise
+
+        # The message lists the whole batch, so it is only built if INFO records are emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Updated %s", ", ".join(f"{key_path} -> {value}" for key_path, value in updates.items()))
+
     def get_data(self, key_path):
         """
         Get the design value using dot notation (as key).
@@ -137,16 +166,28 @@ class DOEDataModel:
         :rtype: any
         """
 
-        keys = key_path.split('.')
+        parents, last = split_key_path(key_path)
         data = self.doe_data
         try:
-            for key in keys:
+            for key in parents:
                 data = data[key]
-            return data
+            return data[last]
         except KeyError as e:
             self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
             raise
 
+    @property
+    def w_cm_curve(self):
+        """
+        The w/cm curve of the last calculation, built on request from its stored coefficients.
+
+        :returns: The curve (strength as a function of the w/cm ratio), or None if it has not been calculated.
+        :rtype: Polynomial | None
+        """
+
+        coefficients = self.doe_data['water_cementitious_materials_ratio']['w_cm_curve_coef']
+        return None if coefficients is None else Polynomial(coefficients)
+
     # -------------------------------------------- Validation methods --------------------------------------------
     def add_calculation_error(self, section, message):
         """
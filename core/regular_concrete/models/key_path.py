@@ -0,0 +1,16 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def split_key_path(key_path):
+    """
+    Split a dot notation key path into its parent keys and its last key.
+    The schemas of the data models are fixed, so each key path is only parsed once.
+
+    :param str key_path: The key path, e.g. 'cementitious_materials.SCM.SCM_type'.
+    :return: A tuple containing the parent keys and the last key.
+    :rtype: tuple[tuple[str, ...], str]
+    """
+
+    *parents, last = key_path.split('.')
+    return tuple(parents), last
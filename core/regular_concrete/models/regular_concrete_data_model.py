@@ -1,8 +1,10 @@
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from core.regular_concrete.models.key_path import split_key_path
 from settings import DEFAULT_UNITS_KEY, DEFAULT_LANGUAGE_KEY, INITIAL_STEP, LANGUAGES, UNIT_SYSTEM
 from logger import Logger
 
+
 class RegularConcreteDataModel(QObject):
     """
     Central data model for the concrete regular procedure.
@@ -310,13 +312,13 @@ class RegularConcreteDataModel(QObject):
         :param any value: The new value to update.
         """
 
-        keys = key_path.split('.')
+        parents, last = split_key_path(key_path)
         data = self.design_data
 
         try:
-            for key in keys[:-1]:
+            for key in parents:
                 data = data[key]
-            data[keys[-1]] = value
+            data[last] = value
             self.logger.info(f"Updated {key_path} -> {value}")
         except KeyError as e:
             self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
@@ -331,16 +333,40 @@ class RegularConcreteDataModel(QObject):
         :rtype: any
         """
 
-        keys = key_path.split('.')
+        parents, last = split_key_path(key_path)
         data = self.design_data
         try:
-            for key in keys:
+            for key in parents:
                 data = data[key]
-            return data
+            return data[last]
         except KeyError as e:
             self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
             raise
 
+    def get_design_values(self, key_paths):
+        """
+        Get several design values at once using dot notation (as keys), in a single call.
+
+        :param tuple[str] key_paths: The key paths to retrieve the values associated.
+        :returns: A dictionary mapping each key path to its value.
+        :rtype: dict[str, any]
+        """
+
+        design_data = self.design_data
+        values = {}
+        for key_path in key_paths:
+            parents, last = split_key_path(key_path)
+            data = design_data
+            try:
+                for key in parents:
+                    data = data[key]
+                values[key_path] = data[last]
+            except KeyError as e:
+                self.logger.error(f"Invalid key path: {key_path} ({str(e)})")
+                raise
+
+        return values
+
     # -------------------------------------------- Validation methods --------------------------------------------
     def add_validation_error(self, section, message):
         """
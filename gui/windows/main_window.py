@@ -18,8 +18,6 @@ from gui.windows.about_dialog import AboutDialog
 from gui.windows.config_dialog import ConfigDialog
 from gui.windows.report_dialog import ReportDialog
 from reports.report_data_model import MCEReportModel, DOEReportModel, ACIReportModel
-from reports.pdf_report_generator import PDFReportGenerator
-from core.regular_concrete.plots.grading_curve_plot_dialog import PlotDialog
 from logger import Logger
 from settings import (ICON_SETTINGS, ICON_PRINT, ICON_EXIT, ICON_ABOUT, ICON_CHECK_DESIGN, ICON_TRIAL_MIX, ICON_RESTART,
                       ICON_HELP_MANUAL, ICON_ADJUST_TRIAL_MIX, ICON_REGULAR_CONCRETE, ICON_ADJUST_MATERIALS,
@@ -317,6 +315,9 @@ class MainWindow(QMainWindow):
 
         self.logger.info('The grading curve plotting dialog has been selected')
 
+        # Imported on demand: pyqtgraph is only needed once a plot is requested, so it stays out of the startup path
+        from core.regular_concrete.plots.grading_curve_plot_dialog import PlotDialog
+
         plot_dialog = PlotDialog(self.data_model, aggregate_type, self)
         plot_dialog.exec()
 
@@ -382,6 +383,9 @@ class MainWindow(QMainWindow):
                 self.logger.warning(f"The current method ({self.data_model.method}) is not valid")
                 return
 
+            # Imported on demand: reportlab is only needed to generate a report, so it stays out of the startup path
+            from reports.pdf_report_generator import PDFReportGenerator
+
             # Create the report generator
             pdf_generator = PDFReportGenerator(
                 file_name,
@@ -1,6 +1,8 @@
 import logging
+import logging.handlers
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from settings import LOG_FORMAT, LOG_LEVEL
@@ -22,6 +24,7 @@ LOG_FILE = get_log_file_path()
 
 class Logger:
     _initialized = False  # Class variable to control initialization
+    _file_buffer = None  # Memory handler that holds the log file records written during startup
 
     def __init__(self, name=None, log_file=LOG_FILE, level=LOG_LEVEL, log_format=LOG_FORMAT):
         """
@@ -59,40 +62,75 @@ class Logger:
         # Format of log messages
         formatter = logging.Formatter(log_format)
 
-        # Handler for writing to a file (FileHandler) (overwrite at start)
-        file_handler = logging.FileHandler(log_file, mode='w')
+        # Handler for writing to a file (FileHandler) (overwrite at start, opened on the first write)
+        file_handler = logging.FileHandler(log_file, mode='w', delay=True)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+
+        # Buffer the file records in memory until startup is over (see flush_startup_logs), so that opening and
+        # writing the log file does not delay the first paint. Errors are always written immediately
+        file_buffer = logging.handlers.MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=file_handler)
+        root_logger.addHandler(file_buffer)
+        Logger._file_buffer = file_buffer
 
         # Handler for writing to the console (ConsoleHandler)
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
 
-    def debug(self, message):
-        """Logs a DEBUG level message."""
+    def isEnabledFor(self, level):
+        """
+        Check whether a message of the given level would be emitted, to skip building costly messages otherwise.
+
+        :param int level: The logging level (e.g. logging.INFO).
+        :rtype: bool
+        """
+
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message, *args):
+        """Logs a DEBUG level message (the args are merged into the message only if the record is emitted)."""
 
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message):
+    def info(self, message, *args):
         """Logs an INFO level message."""
 
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message):
+    def warning(self, message, *args):
         """Logs a WARNING level message."""
 
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message, exc_info=False):
+    def error(self, message, *args, exc_info=False):
         """Logs an ERROR level message.
-        :param str message: Error message.
+        :param str message: Error message, with %-style placeholders for args.
         :param bool exc_info: If True, includes exception information (traceback).
         """
 
-        self.logger.error(message, exc_info=exc_info)
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def critical(self, message):
+    def critical(self, message, *args):
         """Logs a CRITICAL level message."""
 
-        self.logger.critical(message)
\ No newline at end of file
+        self.logger.critical(message, *args)
+
+@lru_cache(maxsize=None)
+def get_logger(name=None):
+    """
+    Return the Logger associated with the given name, creating it only on the first request.
+
+    :param str name: Name of the logger (usually the name of the module).
+    :return: The shared Logger instance for that name.
+    :rtype: Logger
+    """
+
+    return Logger(name)
+
+def flush_startup_logs():
+    """Write the buffered startup records to the log file and write every later record straight through."""
+
+    file_buffer = Logger._file_buffer
+    if file_buffer is not None:
+        file_buffer.capacity = 1
+        file_buffer.flush()
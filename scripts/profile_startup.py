@@ -0,0 +1,73 @@
+"""
+Measure the import cost of the application startup path.
+
+Startup is import-bound rather than compute-bound: the time before the main window is shown is spent resolving
+modules (PyQt6, numpy, the GUI package), not in arithmetic. This script runs ``python -X importtime`` on the
+modules imported before ``window.show()``, prints the most expensive imports and, optionally, fails when the
+total exceeds a threshold so that regressions in the import graph are caught.
+
+Usage (from the project root):
+    python scripts/profile_startup.py --top 20 --max-ms 400
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules imported before the main window is shown (see app.py)
+STARTUP_MODULES = ("app", "gui.windows.main_window")
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure_imports(modules):
+    """
+    Import the given modules in a fresh interpreter with -X importtime and collect the timings.
+
+    :param tuple[str] modules: Dotted names of the modules to import.
+    :return: A list of (module, self time in µs, cumulative time in µs) tuples, in import order.
+    :rtype: list[tuple[str, int, int]]
+    """
+
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+
+    timings = []
+    for line in result.stderr.splitlines():
+        # Format: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((name.strip(), int(self_us), int(cumulative_us)))
+
+    return timings
+
+
+def main():
+    """Print the most expensive startup imports and check the optional threshold."""
+
+    parser = argparse.ArgumentParser(description="Profile the import time of the Concretus startup path.")
+    parser.add_argument("--top", type=int, default=15, help="Number of most expensive imports to display.")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail (exit code 1) if the total startup import time exceeds this value in ms.")
+    args = parser.parse_args()
+
+    timings = measure_imports(STARTUP_MODULES)
+
+    # Top-level entries (no indentation in the importtime output) add up to the total import time
+    total_ms = sum(cumulative for name, _, cumulative in timings if name in STARTUP_MODULES) / 1000
+
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for name, self_us, cumulative_us in sorted(timings, key=lambda t: t[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:16.1f} {self_us / 1000:10.1f}  {name}")
+    print(f"\nTotal startup import time: {total_ms:.1f} ms")
+
+    if args.max_ms is not None and total_ms > args.max_ms:
+        print(f"Startup import time exceeds the {args.max_ms:.1f} ms threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
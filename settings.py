@@ -1487,6 +1487,12 @@ WATER_CONTENT_AE = {
     }
 } # Air-entrained
 
+# Mixing water reduction (in percentage) for every 10 % of the cementitious material replaced by SCM
+WATER_REDUCTION_SCM_ACI = {
+    "Cenizas volantes": 3,
+    "Cemento de escoria": 5
+}
+
 # Maximum water-cementitious materials ratio, by durability
 MAX_W_CM_ACI = {
     "S0": 1.00, # It does not have minimum w_cm ratio; therefore, it is 1.00 by default
@@ -1,8 +1,9 @@
 import unittest
 
-from core.regular_concrete.design_methods.aci import (CementitiousMaterial, Water, Air, FineAggregate, CoarseAggregate,
-                                                      StandardDeviation, AbramsLaw)
+from core.regular_concrete.design_methods.aci import (ACI, CementitiousMaterial, Water, Air, FineAggregate,
+                                                      CoarseAggregate, StandardDeviation, AbramsLaw)
 from core.regular_concrete.models.aci_data_model import ACIDataModel
+from core.regular_concrete.models.regular_concrete_data_model import RegularConcreteDataModel
 
 
 class TestCementitiousMaterial(unittest.TestCase):
@@ -444,6 +445,24 @@ class TestStandardDeviation(unittest.TestCase):
                                                                sample_size, defective_level, std_dev_unknown)
                 self.assertEqual(target_strength, target_strength_expected)
 
+    def test_target_strength_from_instance(self):
+        std_dev = StandardDeviation(
+            std_dev_known=True,
+            std_dev_value=3.5,
+            sample_size=15,
+            defective_level="9",
+            std_dev_unknown=False
+        )
+        std_dev.aci_data_model = self.aci_data_model
+
+        self.assertEqual(std_dev.target_strength(31), std_dev.target_strength(31, True, 3.5, 15, "9", False))
+        self.assertAlmostEqual(std_dev.target_strength(31), 36.9598, delta=0.1)
+
+        # Changing the instance inputs after construction must be taken into account
+        std_dev.sample_size = 30
+        self.assertEqual(std_dev.target_strength(30), std_dev.target_strength(30, True, 3.5, 30, "9", False))
+        self.assertAlmostEqual(std_dev.target_strength(30), 34.6935, delta=0.01) # k = 1.00 (1.16 would give 35.44)
+
 class TestAbramsLaw(unittest.TestCase):
     def setUp(self):
         self.aci_data_model = ACIDataModel()
@@ -540,6 +559,28 @@ class TestAbramsLaw(unittest.TestCase):
                 self.assertAlmostEqual(water_cementitious_materials_ratio, water_cementitious_materials_ratio_expected,
                                        delta=0.015)
 
+class TestACIUnitConversion(unittest.TestCase):
+    def setUp(self):
+        self.data_model = RegularConcreteDataModel()
+        self.data_model.update_design_data('field_requirements.strength.spec_strength', 300)
+        self.data_model.update_design_data('field_requirements.strength.std_dev_known.std_dev_value', 35)
+        self.data_model.update_design_data('validation.exposure_classes', {'W': 'W0', 'F': 'F0', 'S': 'S0', 'C': 'C0'})
+        self.aci = ACI(self.data_model, ACIDataModel())
+
+    def test_stress_inputs_converted_from_mks(self):
+        self.data_model.units = "MKS"
+        self.aci.load_inputs()
+
+        self.assertAlmostEqual(self.aci.hardened_concrete.design_strength, 30)
+        self.assertAlmostEqual(self.aci.std_deviation.std_dev_value, 3.5)
+
+    def test_stress_inputs_not_converted_in_si(self):
+        self.data_model.units = "SI"
+        self.aci.load_inputs()
+
+        self.assertEqual(self.aci.hardened_concrete.design_strength, 300)
+        self.assertEqual(self.aci.std_deviation.std_dev_value, 35)
+
 ##############################################
 # Run all the tests
 ##############################################
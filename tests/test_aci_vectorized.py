@@ -0,0 +1,357 @@
+import copy
+import unittest
+
+import numpy as np
+
+from core.regular_concrete.design_methods import aci_vectorized
+from core.regular_concrete.design_methods.aci import (ACI, CementitiousMaterial, Air, FineAggregate, CoarseAggregate,
+                                                      StandardDeviation, AbramsLaw)
+from core.regular_concrete.models.aci_data_model import ACIDataModel
+from core.regular_concrete.models.regular_concrete_data_model import RegularConcreteDataModel
+
+
+class TestVectorizedCementitiousContent(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.cementitious = CementitiousMaterial(relative_density=3.15)
+        self.cementitious.aci_data_model = self.aci_data_model
+
+    def test_cementitious_content_matches_scalar(self):
+        test_cases = [
+            (175, 0.5, '2" (50 mm)', 0),
+            (175, 0.5, '3/8" (9,5 mm)', 0),
+            (200, 0.5, '1" (25 mm)', 25),
+            (160, 0.45, '3/4" (19 mm)', 10),
+            (190, 0.7, '1/2" (12,5 mm)', 45),
+        ]
+        water_content, w_cm, nms, scm_percentage = map(list, zip(*test_cases))
+
+        cement_content, scm_content = aci_vectorized.cementitious_content(np.array(water_content), np.array(w_cm),
+                                                                          aci_vectorized.nms_to_codes(nms),
+                                                                          np.array(scm_percentage))
+
+        for i, case in enumerate(test_cases):
+            with self.subTest(case=case):
+                cement_expected, scm_expected = self.cementitious.cementitious_content(case[0], case[1], case[2],
+                                                                                       case[3] > 0, case[3])
+                self.assertAlmostEqual(cement_content[i], cement_expected)
+                self.assertAlmostEqual(scm_content[i], scm_expected)
+
+    def test_invalid_nms(self):
+        with self.assertRaises(ValueError):
+            aci_vectorized.nms_to_codes(['N/A (40 mm)'])
+
+class TestVectorizedStandardDeviation(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.std_dev = StandardDeviation(
+            std_dev_known=True,
+            std_dev_value=2.5,
+            sample_size=20,
+            defective_level="10",
+            std_dev_unknown=False
+        )
+        self.std_dev.aci_data_model = self.aci_data_model
+
+    def test_target_strength_known_matches_scalar(self):
+        design_strength = np.array([17, 21, 28, 35, 36, 45])
+        std_dev_value = np.array([2.0, 2.5, 3.0, 3.5, 4.0, 5.0])
+
+        target_strength = aci_vectorized.target_strength_known(design_strength, std_dev_value, 1.08, -1.282)
+
+        for i in range(len(design_strength)):
+            with self.subTest(design_strength=design_strength[i]):
+                target_strength_expected = self.std_dev.target_strength(design_strength[i], True, std_dev_value[i],
+                                                                        20, "10", False)
+                self.assertAlmostEqual(target_strength[i], target_strength_expected)
+
+class TestVectorizedAbramsLaw(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.abrams_law = AbramsLaw()
+        self.abrams_law.aci_data_model = self.aci_data_model
+
+    def test_w_cm_by_strength_matches_scalar(self):
+        target_strength = np.array([15, 20, 25, 30, 35, 40, 45, 15, 20, 25, 30, 35, 40, 45], dtype=float)
+        entrained_air = np.array([False] * 7 + [True] * 7)
+
+        w_cm = aci_vectorized.w_cm_by_strength(target_strength, entrained_air)
+
+        for i in range(len(target_strength)):
+            with self.subTest(target_strength=target_strength[i], entrained_air=entrained_air[i]):
+                w_cm_expected = self.abrams_law.water_cementitious_materials_ratio(target_strength[i],
+                                                                                   entrained_air[i], ['F0'])
+                self.assertAlmostEqual(w_cm[i], w_cm_expected)
+
+class TestVectorizedNMSTables(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.air = Air(entrained_air=False, user_defined=0, exposure_defined=False)
+        self.air.aci_data_model = self.aci_data_model
+        self.coarse_agg = CoarseAggregate(
+            agg_type="coarse",
+            relative_density=2.7,
+            loose_bulk_density=1500,
+            compacted_bulk_density=1600,
+            moisture_content=1.5,
+            moisture_absorption=1.2,
+            grading={},
+            nominal_max_size=""
+        )
+        self.coarse_agg.aci_data_model = self.aci_data_model
+
+    def test_entrapped_air_matches_scalar(self):
+        for nms, code in aci_vectorized.NMS_CODES.items():
+            with self.subTest(nms=nms):
+                self.assertAlmostEqual(aci_vectorized.ENTRAPPED_AIR_FRACTION[code],
+                                       self.air.entrapped_air_volume(nms))
+
+    def test_coarse_content_matches_scalar(self):
+        nms = list(aci_vectorized.NMS_CODES)
+        fineness_modulus = np.linspace(2.4, 3.0, len(nms))
+
+        coarse_content = aci_vectorized.coarse_content(aci_vectorized.nms_to_codes(nms), fineness_modulus, 1600, 1.2)
+
+        for i in range(len(nms)):
+            with self.subTest(nms=nms[i]):
+                coarse_content_expected = self.coarse_agg.coarse_content(nms[i], fineness_modulus[i], 1600, 1.2)
+                self.assertAlmostEqual(coarse_content[i], coarse_content_expected)
+
+class TestAggregateArrays(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.samples = []
+        for relative_density, compacted_bulk_density, moisture_content, absorption in [(2.70, 1600, 1.5, 1.2),
+                                                                                       (2.65, 1550, 0.5, 0.8),
+                                                                                       (2.58, 1480, 2.0, 1.6)]:
+            coarse_agg = CoarseAggregate(
+                agg_type="coarse",
+                relative_density=relative_density,
+                loose_bulk_density=compacted_bulk_density - 100,
+                compacted_bulk_density=compacted_bulk_density,
+                moisture_content=moisture_content,
+                moisture_absorption=absorption,
+                grading={},
+                nominal_max_size='1" (25 mm)'
+            )
+            coarse_agg.aci_data_model = self.aci_data_model
+            self.samples.append(coarse_agg)
+
+    def test_from_samples(self):
+        arrays = aci_vectorized.AggregateArrays.from_samples(self.samples)
+
+        np.testing.assert_array_equal(arrays.relative_density, [2.70, 2.65, 2.58])
+        np.testing.assert_array_equal(arrays.loose_bulk_density, [1500, 1450, 1380])
+        np.testing.assert_array_equal(arrays.moisture_absorption, [1.2, 0.8, 1.6])
+        self.assertEqual(arrays.compacted_bulk_density.dtype, np.float64)
+
+    def test_coarse_content_wet_matches_scalar(self):
+        arrays = aci_vectorized.AggregateArrays.from_samples(self.samples)
+        nms_codes = aci_vectorized.nms_to_codes([sample.nominal_max_size for sample in self.samples])
+
+        coarse_content_ssd = aci_vectorized.coarse_content(nms_codes, 2.8, arrays.compacted_bulk_density,
+                                                           arrays.moisture_absorption)
+        coarse_content_wet = aci_vectorized.content_moisture_correction(coarse_content_ssd, arrays.moisture_content,
+                                                                        arrays.moisture_absorption)
+
+        for i, sample in enumerate(self.samples):
+            with self.subTest(i=i):
+                ssd_expected = sample.coarse_content(sample.nominal_max_size, 2.8, sample.compacted_bulk_density,
+                                                     sample.moisture_absorption)
+                wet_expected = sample.content_moisture_correction(ssd_expected, sample.moisture_content,
+                                                                  sample.moisture_absorption)
+                self.assertAlmostEqual(coarse_content_ssd[i], ssd_expected)
+                self.assertAlmostEqual(coarse_content_wet[i], wet_expected)
+
+class TestVectorizedFineAggregate(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.fine_agg = FineAggregate(
+            agg_type="fine",
+            relative_density=2.65,
+            loose_bulk_density=1600,
+            compacted_bulk_density=1800,
+            moisture_content=2.0,
+            moisture_absorption=1.0,
+            grading={},
+            fineness_modulus=2.8
+        )
+        self.fine_agg.aci_data_model = self.aci_data_model
+
+    def test_fine_content_matches_scalar(self):
+        water_volume = np.array([0.135, 0.180, 0.200])
+        air_volume = np.array([0.080, 0.020, 0.015])
+        cement_abs_volume = np.array([0.145, 0.110, 0.120])
+        scm_abs_volume = np.array([0, 0.020, 0])
+        coarse_abs_volume = np.array([0.400, 0.350, 0.380])
+
+        fine_content_ssd = aci_vectorized.fine_content(water_volume, air_volume, cement_abs_volume, scm_abs_volume,
+                                                       coarse_abs_volume, 2.64, 1000)
+
+        for i in range(len(water_volume)):
+            with self.subTest(i=i):
+                fine_content_expected = self.fine_agg.fine_content(water_volume[i], air_volume[i],
+                                                                   cement_abs_volume[i], scm_abs_volume[i],
+                                                                   coarse_abs_volume[i], 2.64, 1000)
+                self.assertAlmostEqual(fine_content_ssd[i], fine_content_expected)
+
+    def test_fine_content_invalid_volume(self):
+        fine_content_ssd = aci_vectorized.fine_content(np.array([0.5]), 0.1, 0.2, 0.1, 0.3, 2.64, 1000)
+
+        self.assertTrue(np.isnan(fine_content_ssd[0]))
+
+class TestVectorizedMixContents(unittest.TestCase):
+    def setUp(self):
+        self.aci_data_model = ACIDataModel()
+        self.cement = CementitiousMaterial(relative_density=3.15)
+        self.fine_agg = FineAggregate(
+            agg_type="fine",
+            relative_density=2.64,
+            loose_bulk_density=1600,
+            compacted_bulk_density=1750,
+            moisture_content=3.0,
+            moisture_absorption=1.0,
+            grading={},
+            fineness_modulus=2.8
+        )
+        self.coarse_agg = CoarseAggregate(
+            agg_type="coarse",
+            relative_density=2.68,
+            loose_bulk_density=1500,
+            compacted_bulk_density=1600,
+            moisture_content=0.8,
+            moisture_absorption=0.9,
+            grading={},
+            nominal_max_size='1" (25 mm)'
+        )
+        for component in (self.cement, self.fine_agg, self.coarse_agg):
+            component.aci_data_model = self.aci_data_model
+
+    def test_mix_contents_matches_scalar(self):
+        water_content = np.array([190.0, 175.0, 160.0])
+        w_cm = np.array([0.45, 0.55, 0.62])
+        nms = ['3/4" (19 mm)', '1" (25 mm)', '1-1/2" (37,5 mm)']
+        air_volume = np.array([0.02, 0.015, 0.01])
+
+        cement, scm, fine, coarse = aci_vectorized.mix_contents(
+            water_content, w_cm, aci_vectorized.nms_to_codes(nms), 2.8, air_volume, 3.15,
+            aci_vectorized.AggregateArrays.from_samples([self.fine_agg] * 3),
+            aci_vectorized.AggregateArrays.from_samples([self.coarse_agg] * 3)
+        )
+
+        for i in range(len(nms)):
+            with self.subTest(nms=nms[i]):
+                cement_expected, scm_expected = self.cement.cementitious_content(water_content[i], w_cm[i], nms[i],
+                                                                                 False)
+                coarse_expected = self.coarse_agg.coarse_content(nms[i], 2.8, 1600, 0.9)
+                fine_expected = self.fine_agg.fine_content(water_content[i] / 1000, air_volume[i],
+                                                           self.cement.absolute_volume(cement_expected, 1000, 3.15),
+                                                           0, self.coarse_agg.absolute_volume(coarse_expected, 1000,
+                                                                                              2.68),
+                                                           2.64, 1000)
+                self.assertAlmostEqual(cement[i], cement_expected)
+                self.assertAlmostEqual(scm[i], scm_expected)
+                self.assertAlmostEqual(coarse[i], coarse_expected)
+                self.assertAlmostEqual(fine[i], fine_expected)
+
+class TestRunBatch(unittest.TestCase):
+    def setUp(self):
+        self.data_model = RegularConcreteDataModel()
+        self.data_model.units = "SI"
+        for key_path, value in {
+            'field_requirements.slump_range': '75 mm - 100 mm',
+            'field_requirements.strength.spec_strength': 30,
+            'field_requirements.strength.std_dev_known.std_dev_known_enabled': False,
+            'field_requirements.strength.std_dev_known.std_dev_value': 3.5,
+            'field_requirements.strength.std_dev_known.test_nro': 20,
+            'field_requirements.strength.std_dev_known.defective_level': '10',
+            'field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled': True,
+            'field_requirements.entrained_air_content.is_checked': False,
+            'field_requirements.entrained_air_content.user_defined': 5.0,
+            'field_requirements.entrained_air_content.exposure_defined': False,
+            'cementitious_materials.cement_relative_density': 3.15,
+            'cementitious_materials.SCM.SCM_checked': False,
+            'cementitious_materials.SCM.SCM_type': None,
+            'cementitious_materials.SCM.SCM_content': 0,
+            'cementitious_materials.SCM.SCM_relative_density': 2.3,
+            'water.water_density': 1000,
+            'fine_aggregate.info.type': 'Natural',
+            'fine_aggregate.fineness_modulus': 2.75,
+            'fine_aggregate.physical_prop.relative_density_SSD': 2.62,
+            'fine_aggregate.physical_prop.PUS': 1520,
+            'fine_aggregate.physical_prop.PUC': 1650,
+            'fine_aggregate.moisture.moisture_content': 3.0,
+            'fine_aggregate.moisture.absorption_content': 1.2,
+            'coarse_aggregate.info.type': 'Triturado',
+            'coarse_aggregate.NMS': '1" (25 mm)',
+            'coarse_aggregate.physical_prop.relative_density_SSD': 2.68,
+            'coarse_aggregate.physical_prop.PUS': 1480,
+            'coarse_aggregate.physical_prop.PUC': 1600,
+            'coarse_aggregate.moisture.moisture_content': 0.8,
+            'coarse_aggregate.moisture.absorption_content': 0.9,
+            'chemical_admixtures.WRA.WRA_checked': False,
+            'chemical_admixtures.WRA.WRA_action.plasticizer': False,
+            'chemical_admixtures.WRA.WRA_action.water_reducer': False,
+            'chemical_admixtures.WRA.WRA_action.cement_economizer': False,
+            'chemical_admixtures.WRA.WRA_relative_density': 1.2,
+            'chemical_admixtures.WRA.WRA_dosage': 0.8,
+            'chemical_admixtures.WRA.WRA_effectiveness': 10,
+            'chemical_admixtures.AEA.AEA_checked': False,
+            'chemical_admixtures.AEA.AEA_relative_density': 1.05,
+            'chemical_admixtures.AEA.AEA_dosage': 0.05,
+            'validation.exposure_classes': {'W': 'W0', 'F': 'F0', 'S': 'S0', 'C': 'C1'},
+        }.items():
+            self.data_model.update_design_data(key_path, value)
+
+        # Each case overrides the base design above
+        self.test_cases = [
+            {},
+            {'field_requirements.strength.std_dev_known.std_dev_known_enabled': True,
+             'field_requirements.strength.std_dev_unknown.std_dev_unknown_enabled': False,
+             'field_requirements.strength.spec_strength': 40},
+            {'field_requirements.entrained_air_content.is_checked': True,
+             'field_requirements.entrained_air_content.exposure_defined': True,
+             'validation.exposure_classes': {'W': 'W1', 'F': 'F2', 'S': 'S1', 'C': 'C0'},
+             'coarse_aggregate.NMS': '3/4" (19 mm)',
+             'field_requirements.slump_range': '25 mm - 50 mm'},
+            {'cementitious_materials.SCM.SCM_checked': True,
+             'cementitious_materials.SCM.SCM_type': 'Cenizas volantes',
+             'cementitious_materials.SCM.SCM_content': 25,
+             'chemical_admixtures.WRA.WRA_checked': True,
+             'chemical_admixtures.WRA.WRA_action.water_reducer': True},
+            {'field_requirements.entrained_air_content.is_checked': True,
+             'cementitious_materials.SCM.SCM_checked': True,
+             'cementitious_materials.SCM.SCM_type': 'Cemento de escoria',
+             'cementitious_materials.SCM.SCM_content': 40,
+             'chemical_admixtures.WRA.WRA_checked': True,
+             'chemical_admixtures.WRA.WRA_action.cement_economizer': True,
+             'chemical_admixtures.AEA.AEA_checked': True,
+             'coarse_aggregate.info.type': 'Redondeada'},
+        ]
+
+    def test_run_batch_matches_scalar(self):
+        designs, expected_results = [], []
+        for case in self.test_cases:
+            for key_path, value in case.items():
+                self.data_model.update_design_data(key_path, value)
+            aci = ACI(self.data_model, ACIDataModel())
+            self.assertTrue(aci.run())
+            designs.append(copy.deepcopy(self.data_model.design_data))
+            expected_results.append(aci.calculation_results)
+            self.setUp()
+
+        results = aci_vectorized.run_batch(designs, self.data_model.units)
+
+        for i, expected in enumerate(expected_results):
+            for key, values in results.items():
+                with self.subTest(case=i, key=key):
+                    if expected[key] is None:
+                        self.assertTrue(np.isnan(values[i]))
+                    else:
+                        self.assertAlmostEqual(values[i], expected[key])
+
+##############################################
+# Run all the tests
+##############################################
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
 
-from core.regular_concrete.design_methods.doe import (CementitiousMaterial, Water, Air, FineAggregate, CoarseAggregate,
-                                                      StandardDeviation, AbramsLaw, Aggregate)
+from core.regular_concrete.design_methods.doe import (CementitiousMaterial, Cement, SCM, Water, Air, FineAggregate,
+                                                      CoarseAggregate, StandardDeviation, AbramsLaw, Aggregate)
+from core.regular_concrete.design_methods.doe import DOE, _cubic_real_roots
 from core.regular_concrete.models.doe_data_model import DOEDataModel
+from core.regular_concrete.models.regular_concrete_data_model import RegularConcreteDataModel
 
 
 class TestCementitiousMaterial(unittest.TestCase):
@@ -69,6 +71,20 @@ class TestCementitiousMaterial(unittest.TestCase):
                 self.assertAlmostEqual(cement_content, cement_content_expected, delta=0.0001)
                 self.assertEqual(scm_content, 0)
 
+    def test_absolute_volume_data_model_path(self):
+        cement = Cement(relative_density=3.15, cement_class="42.5")
+        scm = SCM(relative_density=2.20, scm_checked=True, scm_type="Cenizas volantes", scm_percentage=25)
+        cement.doe_data_model = self.doe_data_model
+        scm.doe_data_model = self.doe_data_model
+
+        cement_abs_volume = cement.absolute_volume(315, 1000, 3.15, "Cemento")
+        scm_abs_volume = scm.absolute_volume(110, 1000, 2.20, "Cenizas volantes")
+
+        self.assertAlmostEqual(cement_abs_volume, 0.1)
+        self.assertAlmostEqual(scm_abs_volume, 0.05)
+        self.assertAlmostEqual(self.doe_data_model.get_data('cementitious_material.cement.cement_abs_volume_temp'), 100)
+        self.assertAlmostEqual(self.doe_data_model.get_data('cementitious_material.scm.scm_abs_volume_temp'), 50)
+
 class TestWater(unittest.TestCase):
     def setUp(self):
         self.doe_data_model = DOEDataModel()
@@ -596,6 +612,68 @@ class TestAbramsLaw(unittest.TestCase):
                                                                                                         scm_checked)
                 self.assertEqual(water_cementitious_materials_ratio, w_cm_expected)
 
+    def test_w_cm_curve_built_from_stored_coefficients(self):
+        self.assertIsNone(self.doe_data_model.w_cm_curve)
+
+        w_cm = self.abrams_law.water_cementitious_materials_ratio("42.5", ("Triturada", "No triturada"), 35.0,
+                                                                  "28 días", ("XC1",), True)
+        w_cm_curve = self.doe_data_model.w_cm_curve
+        self.assertAlmostEqual(w_cm_curve(w_cm), 35.0, places=6)
+
+    def test_cubic_real_roots(self):
+        test_cases = [
+            ((-6, 11, -6, 1), [1, 2, 3]), # Three real roots: (x - 1)(x - 2)(x - 3)
+            ((-2, 0, 0, 1), [2 ** (1 / 3)]), # One real root and a complex pair: x³ - 2
+            ((2, -5, 4, -1), [1, 1, 2]), # Double root: -(x - 1)²(x - 2)
+            ((-0.006, 0.11, -0.6, 1), [0.1, 0.2, 0.3]),
+            ((113.0228509, -303.17016524, 223.3305028, -54.1631518), [0.5980885201540248]), # A w/cm curve
+            ((-2, 3, 1, 1e-12), [-3.5615528128088303, 0.5615528128088303]), # Negligible cubic term (and a root ~ -1e12)
+        ]
+
+        for coefficients, roots_expected in test_cases:
+            with self.subTest(coefficients=coefficients):
+                roots = [root for root in _cubic_real_roots(coefficients) if -10 <= root <= 10]
+                self.assertEqual(len(roots), len(roots_expected))
+                for root, root_expected in zip(roots, roots_expected):
+                    self.assertAlmostEqual(root, root_expected, delta=1e-7)
+
+class TestDOELoadInputs(unittest.TestCase):
+    def setUp(self):
+        self.data_model = RegularConcreteDataModel()
+        self.data_model.update_design_data('field_requirements.strength.spec_strength', 300)
+        self.data_model.update_design_data('field_requirements.strength.std_dev_known.std_dev_value', 35)
+        self.data_model.update_design_data('field_requirements.strength.std_dev_unknown.margin', 80)
+        self.doe = DOE(self.data_model, DOEDataModel())
+
+    def test_stress_inputs_converted_from_mks(self):
+        self.data_model.units = "MKS"
+        self.doe.load_inputs()
+
+        self.assertAlmostEqual(self.doe.hardened_concrete.design_strength, 30)
+        self.assertAlmostEqual(self.doe.std_deviation.std_dev_value, 3.5)
+        self.assertAlmostEqual(self.doe.std_deviation.user_defined_margin, 8)
+
+    def test_components_reused_while_inputs_unchanged(self):
+        self.doe.load_inputs()
+        cement = self.doe.cement
+        self.doe.load_inputs()
+        self.assertIs(self.doe.cement, cement)
+
+        self.data_model.update_design_data('cementitious_materials.cement_relative_density', 3.10)
+        self.doe.load_inputs()
+        self.assertIsNot(self.doe.cement, cement)
+        self.assertEqual(self.doe.cement.relative_density, 3.10)
+
+    def test_components_rebuilt_after_in_place_edit(self):
+        exposure_classes = {'A': 'XC1', 'B': 'X0', 'C': 'X0', 'D': 'X0'}
+        self.data_model.update_design_data('validation.exposure_classes', exposure_classes)
+        self.doe.load_inputs()
+        cement = self.doe.cement
+
+        exposure_classes['A'] = 'XC3'
+        self.doe.load_inputs()
+        self.assertIsNot(self.doe.cement, cement)
+
 ##############################################
 # Run all the tests
 ##############################################
@@ -0,0 +1,76 @@
+import unittest
+
+import numpy as np
+
+from core.regular_concrete.design_methods import doe_vectorized
+from core.regular_concrete.design_methods.doe import CementitiousMaterial, Water, Aggregate
+from core.regular_concrete.models.doe_data_model import DOEDataModel
+
+
+class TestVectorizedVolumes(unittest.TestCase):
+    def setUp(self):
+        self.doe_data_model = DOEDataModel()
+        self.cementitious = CementitiousMaterial(relative_density=3.15)
+        self.water = Water(density=1000)
+        self.agg = Aggregate(
+            agg_type="Triturada",
+            relative_density=2.65,
+            loose_bulk_density=1500,
+            compacted_bulk_density=1600,
+            moisture_content=3.0,
+            moisture_absorption=1.5,
+            grading={}
+        )
+        for component in (self.cementitious, self.water, self.agg):
+            component.doe_data_model = self.doe_data_model
+
+    def test_volumes_match_scalar(self):
+        content = np.array([350.0, 180.0, 720.5, 1045.25])
+        relative_density = np.array([3.15, 2.20, 2.65, 2.71])
+        loose_bulk_density = np.array([1500.0, 1420.0, 1610.0, 1555.5])
+        moisture_content = np.array([0.0, 2.5, 4.0, -1.0])
+        absorption = np.array([1.5, 0.8, 2.1, 0.5])
+
+        water_volume = doe_vectorized.water_volume(content, 1000)
+        absolute_volume = doe_vectorized.absolute_volume(content, 1000, relative_density)
+        apparent_volume = doe_vectorized.apparent_volume(content, loose_bulk_density)
+        wet_content = doe_vectorized.content_moisture_correction(content, moisture_content, absorption)
+
+        for i in range(len(content)):
+            with self.subTest(i=i):
+                self.assertAlmostEqual(water_volume[i], self.water.water_volume(content[i], 1000))
+                self.assertAlmostEqual(absolute_volume[i],
+                                       self.cementitious.absolute_volume(content[i], 1000, relative_density[i]))
+                self.assertAlmostEqual(absolute_volume[i],
+                                       self.agg.absolute_volume(content[i], 1000, relative_density[i]))
+                self.assertAlmostEqual(apparent_volume[i],
+                                       self.agg.apparent_volume(content[i], loose_bulk_density[i]))
+                self.assertAlmostEqual(wet_content[i],
+                                       self.agg.content_moisture_correction(content[i], moisture_content[i],
+                                                                            absorption[i]))
+
+    def test_zero_denominators_give_nan(self):
+        content = np.array([350.0, 180.0, 720.5])
+
+        absolute_volume = doe_vectorized.absolute_volume(content, np.array([1000, 0, 1000]), np.array([3.15, 2.2, 0]))
+        apparent_volume = doe_vectorized.apparent_volume(content, np.array([1500.0, 0, 1610.0]))
+        wet_content = doe_vectorized.content_moisture_correction(content, 2.0, np.array([1.5, -100, 2.1]))
+        water_volume = doe_vectorized.water_volume(content, np.array([1000, 1000, 0]))
+
+        np.testing.assert_array_equal(np.isnan(absolute_volume), [False, True, True])
+        np.testing.assert_array_equal(np.isnan(apparent_volume), [False, True, False])
+        np.testing.assert_array_equal(np.isnan(wet_content), [False, True, False])
+        np.testing.assert_array_equal(np.isnan(water_volume), [False, False, True])
+
+        # The scalar methods raise on the same samples
+        with self.assertRaises(ZeroDivisionError):
+            self.agg.apparent_volume(content[1], 0)
+        with self.assertRaises(ValueError):
+            self.agg.content_moisture_correction(content[1], 2.0, -100)
+
+
+##############################################
+# Run all the tests
+##############################################
+if __name__ == '__main__':
+    unittest.main()